@@ -222,6 +222,7 @@ private:
     py::object m_pipeline;
     
     std::map<std::string, py::dict> m_genres;
+    py::object m_genresDict;  // Loaded definitions, passed as-is to every call
     std::mutex m_pythonMutex;  // Python GIL helper
     
     GhostHandsCallback m_ghostHandsCallback;
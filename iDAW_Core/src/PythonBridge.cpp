@@ -5,9 +5,6 @@
 #include "PythonBridge.h"
 #include <fstream>
 #include <sstream>
-#include <nlohmann/json.hpp>  // For JSON parsing
-
-using json = nlohmann::json;
 
 namespace iDAW {
 
@@ -87,6 +84,7 @@ void PythonBridge::shutdown() {
     m_pipeline = py::none();
     m_orchestratorModule = py::none();
     m_genres.clear();
+    m_genresDict = py::none();
     m_interpreter.reset();
     m_initialized = false;
 }
@@ -98,37 +96,15 @@ bool PythonBridge::loadGenresJson(const std::string& path) {
             return false;
         }
         
-        json genresData;
-        file >> genresData;
+        // Load through the orchestrator's own loader: it parses the file
+        // once, and handing the same dict to every call_iMIDI lets genre
+        // detection reuse its memoized scorer across prompts
+        auto genres = py::module_::import("music_brain.orchestrator.bridge_api")
+            .attr("load_genre_definitions")(path).cast<py::dict>();
         
-        // Convert to Python dicts and store
-        for (auto& [name, data] : genresData["genres"].items()) {
-            py::dict genreDict;
-            // Convert JSON to Python dict recursively
-            std::function<py::object(const json&)> jsonToPy = [&](const json& j) -> py::object {
-                if (j.is_null()) return py::none();
-                if (j.is_boolean()) return py::bool_(j.get<bool>());
-                if (j.is_number_integer()) return py::int_(j.get<int>());
-                if (j.is_number_float()) return py::float_(j.get<double>());
-                if (j.is_string()) return py::str(j.get<std::string>());
-                if (j.is_array()) {
-                    py::list list;
-                    for (const auto& item : j) {
-                        list.append(jsonToPy(item));
-                    }
-                    return list;
-                }
-                if (j.is_object()) {
-                    py::dict dict;
-                    for (auto& [k, v] : j.items()) {
-                        dict[py::str(k)] = jsonToPy(v);
-                    }
-                    return dict;
-                }
-                return py::none();
-            };
-            
-            m_genres[name] = jsonToPy(data).cast<py::dict>();
+        m_genresDict = genres;
+        for (auto item : genres) {
+            m_genres[item.first.cast<std::string>()] = item.second.cast<py::dict>();
         }
         
         return true;
@@ -165,10 +141,7 @@ MidiBuffer PythonBridge::call_iMIDI(const KnobState& knobs,
         py::dict inputData;
         inputData["text_prompt"] = safePrompt;  // Use sanitized input
         inputData["knobs"] = knobs.toPyDict();
-        inputData["genres"] = py::dict();  // Pass available genres
-        for (const auto& [name, data] : m_genres) {
-            inputData["genres"][py::str(name)] = data;
-        }
+        inputData["genres"] = m_genresDict;  // Pass available genres
         
         // Check for innovation protocol
         if (shouldTriggerInnovation()) {
@@ -28,6 +28,80 @@ from music_brain.audio.chord_detection import ChordDetector, ChordProgressionDet
 from music_brain.audio.frequency_analysis import analyze_frequency_bands, FrequencyProfile
 
 
+NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+
+# Major and minor key profiles (Krumhansl)
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+
+def _build_key_templates() -> "np.ndarray":
+    """
+    Precompute every rotated key profile, z-normalized.
+
+    Row ``2 * shift + mode`` (mode 0 = major, 1 = minor) holds the profile
+    for the key ``shift`` semitones above C. Correlating a chroma vector
+    against all 24 keys is then a single matrix-vector product.
+    """
+    rows = []
+    for shift in range(12):
+        for profile in (MAJOR_PROFILE, MINOR_PROFILE):
+            rows.append(np.roll(np.asarray(profile), shift))
+
+    templates = np.array(rows)
+    templates -= templates.mean(axis=1, keepdims=True)
+    templates /= np.linalg.norm(templates, axis=1, keepdims=True)
+    return templates
+
+
+_KEY_TEMPLATES = _build_key_templates() if NUMPY_AVAILABLE else None
+
+# Peak amplitude below which audio is treated as silence
+SILENCE_THRESHOLD = 1e-4
+
+# Key reported when there is no pitch content to go on (silent input)
+FALLBACK_KEY: Tuple[str, str] = (NOTE_NAMES[0], "major")
+
+
+def _trim_silence(samples: "np.ndarray", hop_length: int) -> "np.ndarray":
+    """
+    Strip leading and trailing near-silent frames.
+
+    Trimming is aligned to ``hop_length`` so frame boundaries match the
+    untrimmed signal. Returns an empty array if nothing exceeds
+    SILENCE_THRESHOLD.
+    """
+    loud = np.flatnonzero(np.abs(samples) > SILENCE_THRESHOLD)
+    if loud.size == 0:
+        return samples[:0]
+
+    start = (loud[0] // hop_length) * hop_length
+    stop = (loud[-1] // hop_length + 1) * hop_length
+    return samples[start:stop]
+
+
+def _key_from_chroma(chroma: "np.ndarray") -> Tuple[str, str]:
+    """
+    Detect key from chromagram.
+
+    Uses Krumhansl-Schmuckler key-finding algorithm.
+    """
+    # Silent frames carry no pitch information; leave them out of the average
+    active = chroma.max(axis=0) > SILENCE_THRESHOLD
+    if not active.any():
+        return FALLBACK_KEY
+
+    # Average chroma, centered and scaled so the dot product is Pearson r
+    chroma_mean = np.mean(chroma[:, active], axis=1)
+    centered = chroma_mean - chroma_mean.mean()
+    norm = np.linalg.norm(centered)
+    if norm == 0:
+        return FALLBACK_KEY
+
+    best = int(np.argmax(_KEY_TEMPLATES @ (centered / norm)))
+    return NOTE_NAMES[best // 2], ("major", "minor")[best % 2]
+
+
 @dataclass
 class AudioAnalysis:
     """
@@ -237,18 +311,24 @@ class AudioAnalyzer:
         # RMS energy
         rms = librosa.feature.rms(y=samples, hop_length=self.hop_length)[0]
         rms_db = librosa.amplitude_to_db(rms)
-        dynamic_range = float(np.max(rms_db) - np.min(rms_db[rms_db > -60]))
+        audible = rms_db[rms_db > -60]
+        # All-quiet input has no audible floor to measure against
+        dynamic_range = float(np.max(rms_db) - np.min(audible)) if audible.size else 0.0
 
         # Spectral features
         spectral_centroid = librosa.feature.spectral_centroid(
             y=samples, sr=sample_rate, hop_length=self.hop_length
         )[0]
 
-        # Chromagram for key detection
-        chroma = librosa.feature.chroma_cqt(
-            y=samples, sr=sample_rate, hop_length=self.hop_length
-        )
-        key, mode = self._detect_key_from_chroma(chroma)
+        # Chromagram for key detection, skipping the CQT on dead air
+        voiced = _trim_silence(samples, self.hop_length)
+        if voiced.size:
+            chroma = librosa.feature.chroma_cqt(
+                y=voiced, sr=sample_rate, hop_length=self.hop_length
+            )
+            key, mode = self._detect_key_from_chroma(chroma)
+        else:
+            key, mode = FALLBACK_KEY
 
         return AudioAnalysis(
             filename="<waveform>",
@@ -312,6 +392,10 @@ class AudioAnalyzer:
         if len(samples.shape) > 1:
             samples = np.mean(samples, axis=1)
 
+        samples = _trim_silence(samples, self.hop_length)
+        if not samples.size:
+            return FALLBACK_KEY
+
         # Compute chromagram
         chroma = librosa.feature.chroma_cqt(
             y=samples, sr=sample_rate, hop_length=self.hop_length
@@ -323,43 +407,8 @@ class AudioAnalyzer:
         self,
         chroma: "np.ndarray",
     ) -> Tuple[str, str]:
-        """
-        Detect key from chromagram.
-
-        Uses Krumhansl-Schmuckler key-finding algorithm.
-        """
-        NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-
-        # Major and minor key profiles (Krumhansl)
-        MAJOR_PROFILE = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88])
-        MINOR_PROFILE = np.array([6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17])
-
-        # Average chroma
-        chroma_mean = np.mean(chroma, axis=1)
-
-        best_corr = -1
-        best_key = 0
-        best_mode = "major"
-
-        for shift in range(12):
-            # Rotate chroma to align with each possible key
-            rotated = np.roll(chroma_mean, -shift)
-
-            # Correlate with major profile
-            major_corr = np.corrcoef(rotated, MAJOR_PROFILE)[0, 1]
-            if major_corr > best_corr:
-                best_corr = major_corr
-                best_key = shift
-                best_mode = "major"
-
-            # Correlate with minor profile
-            minor_corr = np.corrcoef(rotated, MINOR_PROFILE)[0, 1]
-            if minor_corr > best_corr:
-                best_corr = minor_corr
-                best_key = shift
-                best_mode = "minor"
-
-        return NOTE_NAMES[best_key], best_mode
+        """Detect key from chromagram (Krumhansl-Schmuckler)."""
+        return _key_from_chroma(chroma)
 
 
 # Convenience function
@@ -17,28 +17,61 @@ Usage from Python (testing):
 """
 
 import json
+import sys
 import asyncio
 import math
-import hashlib
-from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple
+import zlib
+from array import array
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterable, List, Mapping, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from music_brain.orchestrator import AIOrchestrator, Pipeline, OrchestratorConfig
 from music_brain.orchestrator.processors import IntentProcessor, HarmonyProcessor, GrooveProcessor
 from music_brain.orchestrator.interfaces import ProcessorResult, ExecutionContext
 
+# No per-instance __dict__ for the per-event records where supported (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # SAFETY & ROBUSTNESS FUNCTIONS
 # =============================================================================
 
+# Valid (min, max) range per parameter, enforced by resolve_contradictions
+_CLAMPS: Dict[str, Tuple[float, float]] = {
+    "chaos": (0.0, 1.0),
+    "complexity": (0.0, 1.0),
+    "swing": (0.0, 1.0),
+    "gate": (0.0, 1.0),
+    "tempo": (20, 300),   # too slow or too fast
+    "grid": (1, 64),      # grid resolution
+}
+
+
 def resolve_contradictions(params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Resolve contradictory parameter values to ensure safe operation.
     
     Handles cases like:
-    - Infinite gain with positive modulation
+    - Infinite (or NaN) gain with positive modulation
     - Velocity min > velocity max
     - Other logical contradictions
     
@@ -46,41 +79,41 @@ def resolve_contradictions(params: Dict[str, Any]) -> Dict[str, Any]:
         params: Parameter dictionary to validate and fix
         
     Returns:
-        Cleaned parameter dictionary with contradictions resolved
+        Cleaned parameter dictionary with contradictions resolved. When
+        nothing needs fixing this is ``params`` itself, not a copy.
     """
-    resolved = params.copy()
+    fixes: Dict[str, Any] = {}
     
-    # Handle gain contradictions
-    if 'gain' in resolved and 'gain_mod' in resolved:
-        if resolved['gain'] == -math.inf and resolved['gain_mod'] > 0:
-            resolved['gain'] = -6.0  # Default to safe volume if contradiction
+    # Handle gain contradictions (non-finite gain being modulated)
+    gain, gain_mod = params.get('gain'), params.get('gain_mod')
+    if gain is not None and gain_mod is not None and not math.isfinite(gain) and gain_mod > 0:
+        fixes['gain'] = -6.0  # Default to safe volume if contradiction
     
     # Handle velocity range contradictions
-    if 'velocity_min' in resolved and 'velocity_max' in resolved:
-        if resolved['velocity_min'] > resolved['velocity_max']:
-            avg = (resolved['velocity_min'] + resolved['velocity_max']) / 2
-            resolved['velocity_min'] = avg
-            resolved['velocity_max'] = avg
-    
-    # Handle chaos/complexity range clipping
-    for key in ['chaos', 'complexity', 'swing', 'gate']:
-        if key in resolved:
-            resolved[key] = max(0.0, min(1.0, resolved[key]))
-    
-    # Handle tempo contradictions (too slow or too fast)
-    if 'tempo' in resolved:
-        resolved['tempo'] = max(20, min(300, resolved['tempo']))
-    
-    # Handle grid resolution contradictions
-    if 'grid' in resolved:
-        resolved['grid'] = max(1, min(64, resolved['grid']))
+    vmin, vmax = params.get('velocity_min'), params.get('velocity_max')
+    if vmin is not None and vmax is not None and vmin > vmax:
+        fixes['velocity_min'] = fixes['velocity_max'] = (vmin + vmax) * 0.5
+    
+    # Clamp every ranged parameter that is present
+    for key, (lo, hi) in _CLAMPS.items():
+        value = params.get(key)
+        if value is not None:
+            clamped = max(lo, min(hi, value))
+            if clamped != value:
+                fixes[key] = clamped
     
     # Handle attack/release time contradictions (attack > release)
-    if 'attack' in resolved and 'release' in resolved:
-        if resolved['attack'] > resolved['release']:
-            # Swap them if attack is longer than release
-            resolved['attack'], resolved['release'] = resolved['release'], resolved['attack']
+    attack, release = params.get('attack'), params.get('release')
+    if attack is not None and release is not None and attack > release:
+        # Swap them if attack is longer than release
+        fixes['attack'], fixes['release'] = release, attack
+    
+    # Already-valid snapshots (the common case) skip the copy
+    if not fixes:
+        return params
     
+    resolved = params.copy()
+    resolved.update(fixes)
     return resolved
 
 
@@ -121,13 +154,63 @@ _synesthesia_dictionary: Dict[str, Dict[str, float]] = {
     "static": {"chaos": 0.1, "complexity": 0.2},
 }
 
+# The same table as (chaos, complexity) tuples with interned keys, built once
+# at import for the hot lookup path
+_SYNESTHESIA: Dict[str, Tuple[float, float]] = {
+    sys.intern(word): (params["chaos"], params["complexity"])
+    for word, params in _synesthesia_dictionary.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _get_parameter_cached(word_lower: str) -> Tuple[float, float]:
+    """(chaos, complexity) for a normalized word from the default dictionary."""
+    hit = _SYNESTHESIA.get(word_lower)
+    if hit is not None:
+        return hit
+    return _synesthesia_fallback(word_lower)
 
-def get_parameter(word: str, dictionary: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, float]:
+
+# Scales a 16-bit slice of the word hash onto 0.0-1.0
+_INV_UINT16_MAX = 1.0 / 0xFFFF
+
+
+def _synesthesia_hash(word_lower: str) -> int:
+    """32-bit CRC of the word; stable across processes and Python versions."""
+    return zlib.crc32(word_lower.encode('utf-8'))
+
+
+def _synesthesia_fallback(word_lower: str) -> Tuple[float, float]:
+    """
+    The "Synesthesia" Fallback.
+
+    Turn unknown words into deterministic random values.
+    """
+    word_hash = _synesthesia_hash(word_lower)
+    
+    # Chaos from the low 16 bits, complexity from the high 16 bits
+    chaos = (word_hash & 0xFFFF) * _INV_UINT16_MAX
+    complexity = (word_hash >> 16) * _INV_UINT16_MAX
+    
+    return chaos, complexity
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase ASCII text; full Unicode case folding only when needed."""
+    return text.lower() if text.isascii() else text.casefold()
+
+
+def get_parameter(
+    word: str,
+    dictionary: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, float]:
     """
     Get parameters for a word from dictionary, with Synesthesia fallback.
     
     If word is not in dictionary, generates deterministic random values
     based on word hash - turning unknown words into musical parameters.
+    Lookups against the default dictionary are memoized per normalized
+    word; each call still returns a fresh dict the caller may modify.
     
     Args:
         word: The word to look up
@@ -136,30 +219,24 @@ def get_parameter(word: str, dictionary: Optional[Dict[str, Dict[str, float]]] =
     Returns:
         Dict with 'chaos' and 'complexity' values (0.0-1.0)
     """
-    if dictionary is None:
-        dictionary = _synesthesia_dictionary
+    word_lower = _fold_case(word.strip())
     
-    word_lower = word.lower().strip()
-    
-    if word_lower in dictionary:
-        return dictionary[word_lower]
+    if dictionary is None:
+        chaos, complexity = _get_parameter_cached(word_lower)
+    elif word_lower in dictionary:
+        return dict(dictionary[word_lower])
     else:
-        # The "Synesthesia" Fallback
-        # Turn unknown words into deterministic random values
-        word_hash = hashlib.sha256(word_lower.encode('utf-8')).hexdigest()
-        seed = int(word_hash, 16) % 100
-        
-        # Generate chaos from first part of hash
-        chaos = seed / 100.0
-        
-        # Generate complexity from different part of hash for variety
-        complexity_seed = int(word_hash[16:32], 16) % 100
-        complexity = complexity_seed / 100.0
-        
-        return {"chaos": chaos, "complexity": complexity}
+        chaos, complexity = _synesthesia_fallback(word_lower)
+    
+    return {"chaos": chaos, "complexity": complexity}
+
+
+def clear_parameter_cache() -> None:
+    """Drop memoized get_parameter lookups (e.g. after a dictionary reload)."""
+    _get_parameter_cached.cache_clear()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MidiEvent:
     """MIDI event matching C++ MidiEvent struct."""
     status: int      # MIDI status byte
@@ -176,7 +253,16 @@ class MidiEvent:
         }
 
 
-@dataclass
+# Column layout for BridgeResult.event_columns(), matching the C++ struct widths
+MIDI_EVENT_COLUMNS: Tuple[Tuple[str, Any], ...] = (
+    ("status", np.uint8),
+    ("data1", np.uint8),
+    ("data2", np.uint8),
+    ("timestamp", np.int64),
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class KnobState:
     """Current state of Side B UI knobs."""
     grid: float = 16.0       # Grid resolution (4-32)
@@ -187,16 +273,34 @@ class KnobState:
     
     @classmethod
     def from_dict(cls, d: Dict[str, float]) -> "KnobState":
-        return cls(
-            grid=d.get("grid", 16.0),
-            gate=d.get("gate", 0.75),
-            swing=d.get("swing", 0.5),
-            chaos=d.get("chaos", 0.5),
-            complexity=d.get("complexity", 0.5),
+        return cls(*[d.get(name, default) for name, default in _KNOB_DEFAULTS])
+
+
+# (name, default) per KnobState field in declaration order, so from_dict
+# can construct positionally
+_KNOB_DEFAULTS: Tuple[Tuple[str, float], ...] = tuple(
+    (f.name, f.default) for f in fields(KnobState)
+)
+
+
+def unpack_midi_events(packed: Iterable[int]) -> List[MidiEvent]:
+    """Rebuild MidiEvents from BridgeResult.packed_events() words."""
+    return [
+        MidiEvent(
+            status=(word >> 16) & 0xFF,
+            data1=(word >> 8) & 0xFF,
+            data2=word & 0xFF,
+            timestamp=word >> 24,
         )
+        for word in packed
+    ]
+
+
+# Shared read-only metadata for results that carry none (errors, defaults)
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BridgeResult:
     """Result from the Python bridge processing."""
     success: bool
@@ -205,7 +309,7 @@ class BridgeResult:
     suggested_complexity: float = 0.5
     detected_genre: str = ""
     error_message: str = ""
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -215,53 +319,201 @@ class BridgeResult:
             "suggested_complexity": self.suggested_complexity,
             "detected_genre": self.detected_genre,
             "error_message": self.error_message,
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
+    
+    def packed_events(self) -> array:
+        """
+        MIDI events packed one per uint64 into a single flat buffer.
+        
+        Each word is ``timestamp << 24 | status << 16 | data1 << 8 | data2``;
+        the C++ side can copy the buffer wholesale (``buffer_info()`` gives
+        its address and length). unpack_midi_events() reverses it.
+        """
+        return array("Q", [
+            (e.timestamp << 24) | (e.status << 16) | (e.data1 << 8) | e.data2
+            for e in self.midi_events
+        ])
+    
+    def to_json_bytes(self) -> bytes:
+        """to_dict() as UTF-8 JSON, serialized by orjson when available."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self.to_dict()).encode("utf-8")
+    
+    def event_columns(self) -> Dict[str, np.ndarray]:
+        """
+        MIDI events as one contiguous array per field.
+        
+        Bulk consumers can hand each column's ``tobytes()`` across the
+        bridge instead of walking per-event dicts.
+        """
+        count = len(self.midi_events)
+        return {
+            name: np.fromiter(map(attrgetter(name), self.midi_events), dtype=dtype, count=count)
+            for name, dtype in MIDI_EVENT_COLUMNS
+        }
+
 
+# Default GenreDefinitions.json location, remembered once one is found
+_default_genre_file: Optional[str] = None
 
-# Global genre definitions cache
-_genre_definitions: Dict[str, Any] = {}
+# The genres dict currently held by the load_genre_definitions cache
+_loaded_genres: Optional[Dict[str, Any]] = None
+
+
+def _default_genre_path() -> Optional[str]:
+    """First existing GenreDefinitions.json among the default locations."""
+    global _default_genre_file
+    
+    if _default_genre_file is None:
+        repo_root = Path(__file__).parent.parent.parent.parent
+        possible_paths = [
+            repo_root / "iDAW_Core" / "data" / "GenreDefinitions.json",
+            Path("iDAW_Core/data/GenreDefinitions.json"),
+            Path("data/GenreDefinitions.json"),
+        ]
+        for p in possible_paths:
+            if p.exists():
+                _default_genre_file = str(p)
+                break
+    
+    return _default_genre_file
+
+
+@lru_cache(maxsize=1)
+def _load_genre_file(path: str) -> Dict[str, Any]:
+    """
+    Parse the "genres" table of a definitions file.
+    
+    A missing file raises FileNotFoundError, which lru_cache does not
+    remember, so the file is looked for again on the next call.
+    """
+    global _loaded_genres
+    
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    _loaded_genres = data.get("genres", {})
+    return _loaded_genres
 
 
 def load_genre_definitions(path: Optional[str] = None) -> Dict[str, Any]:
     """
     Load genre definitions from JSON file.
     
+    The file is parsed once; later calls for the same path return the same
+    dict, which callers must treat as read-only.
+    
     Args:
         path: Path to GenreDefinitions.json. If None, uses default location.
         
     Returns:
         Dict of genre definitions
     """
-    global _genre_definitions
+    if path is None:
+        path = _default_genre_path()
+    if not path:
+        return {}
     
-    if _genre_definitions:
-        return _genre_definitions
+    try:
+        return _load_genre_file(str(path))
+    except FileNotFoundError:
+        return {}
+
+
+# (pattern, weight) rules per genre, lowercased once per genres dict
+_GenreIndex = Tuple[Tuple[str, Tuple[Tuple[str, float], ...]], ...]
+
+# Loaded genres dict and its memoized scorer (folded text -> result)
+_GenreScorer = Callable[[str], Tuple[str, float]]
+_genre_scorer_cache: Tuple[Optional[Dict[str, Any]], Optional[_GenreScorer]] = (None, None)
+
+
+def _score_genres(index: _GenreIndex, automaton: Any, text_lower: str) -> Tuple[str, float]:
+    """Best-scoring genre and its confidence for already case-folded text."""
+    if automaton is not None:
+        # One pass finds every pattern occurring in the prompt; the empty
+        # pattern is a substring of everything
+        found = {pattern for _, pattern in automaton.iter(text_lower)}
+        found.add("")
+        matches = found.__contains__
+    else:
+        matches = text_lower.__contains__
     
-    if path is None:
-        # Try default locations
-        possible_paths = [
-            Path(__file__).parent.parent.parent.parent / "iDAW_Core" / "data" / "GenreDefinitions.json",
-            Path("iDAW_Core/data/GenreDefinitions.json"),
-            Path("data/GenreDefinitions.json"),
-        ]
-        for p in possible_paths:
-            if p.exists():
-                path = str(p)
-                break
+    best_genre = ""
+    best_score = 0.0
     
-    if path and Path(path).exists():
-        with open(path, 'r') as f:
-            data = json.load(f)
-            _genre_definitions = data.get("genres", {})
+    for genre_name, rules in index:
+        # Genre name mention (2.0), emotional tags (1.0), modes (0.5)
+        score = 0.0
+        for pattern, weight in rules:
+            if matches(pattern):
+                score += weight
+        
+        if score > best_score:
+            best_score = score
+            best_genre = genre_name
     
-    return _genre_definitions
+    # Normalize confidence
+    confidence = min(best_score / 5.0, 1.0)
+    
+    return best_genre, confidence
+
+
+def _genre_scorer(genres: Dict[str, Any]) -> _GenreScorer:
+    """
+    Compile genre names, emotional tags and modes into a memoized scorer.
+    
+    With pyahocorasick installed, every pattern also goes into one
+    automaton so a prompt is scanned once instead of once per pattern.
+    Only used for the dict load_genre_definitions caches; the scorer, and
+    the prompts it has already seen, are reused until that dict changes.
+    
+    Genre names are interned, so comparisons against the returned
+    detected_genre usually short-circuit on identity.
+    """
+    global _genre_scorer_cache
+    
+    cached_genres, scorer = _genre_scorer_cache
+    if cached_genres is genres and scorer is not None:
+        return scorer
+    
+    index = tuple(
+        (sys.intern(genre_name), tuple(
+            [(genre_name.replace("_", " "), 2.0)]
+            + [(_fold_case(tag), 1.0) for tag in genre_data.get("emotional_tags", [])]
+            + [(_fold_case(mode), 0.5)
+               for mode in genre_data.get("harmony", {}).get("preferred_modes", [])]
+        ))
+        for genre_name, genre_data in genres.items()
+    )
+    
+    automaton = None
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for _, rules in index:
+            for pattern, _ in rules:
+                if pattern:
+                    automaton.add_word(pattern, pattern)
+        if len(automaton):
+            automaton.make_automaton()
+        else:
+            automaton = None
+    
+    scorer = lru_cache(maxsize=512)(partial(_score_genres, index, automaton))
+    _genre_scorer_cache = (genres, scorer)
+    return scorer
 
 
 def detect_genre_from_text(text: str, genres: Dict[str, Any]) -> Tuple[str, float]:
     """
     Detect genre from text prompt using emotional tags.
     
+    For the dict returned by load_genre_definitions (read-only), patterns
+    are compiled once and results are memoized per prompt. Any other
+    genres dict is scanned directly, so callers may build or edit their
+    own freely.
+    
     Args:
         text: User text prompt
         genres: Available genre definitions
@@ -269,28 +521,29 @@ def detect_genre_from_text(text: str, genres: Dict[str, Any]) -> Tuple[str, floa
     Returns:
         Tuple of (genre_name, confidence)
     """
-    text_lower = text.lower()
+    text_lower = _fold_case(text)
+    if genres is _loaded_genres:
+        return _genre_scorer(genres)(text_lower)
     
     best_genre = ""
     best_score = 0.0
     
     for genre_name, genre_data in genres.items():
         score = 0.0
-        emotional_tags = genre_data.get("emotional_tags", [])
         
         # Check for genre name mention
         if genre_name.replace("_", " ") in text_lower:
             score += 2.0
         
-        # Check for emotional tags
-        for tag in emotional_tags:
-            if tag.lower() in text_lower:
+        # Check for emotional tags (casefold() equals _fold_case() here,
+        # minus a Python-level call per tag)
+        for tag in genre_data.get("emotional_tags", []):
+            if tag.casefold() in text_lower:
                 score += 1.0
         
         # Check for mode mentions
-        modes = genre_data.get("harmony", {}).get("preferred_modes", [])
-        for mode in modes:
-            if mode.lower() in text_lower:
+        for mode in genre_data.get("harmony", {}).get("preferred_modes", []):
+            if mode.casefold() in text_lower:
                 score += 0.5
         
         if score > best_score:
@@ -303,6 +556,20 @@ def detect_genre_from_text(text: str, genres: Dict[str, Any]) -> Tuple[str, floa
     return best_genre, confidence
 
 
+def clear_genre_cache() -> None:
+    """
+    Forget the loaded genre definitions and the scorer compiled from them.
+    
+    The next load_genre_definitions call re-reads the file, e.g. after it
+    was edited.
+    """
+    global _default_genre_file, _loaded_genres, _genre_scorer_cache
+    _default_genre_file = None
+    _loaded_genres = None
+    _load_genre_file.cache_clear()
+    _genre_scorer_cache = (None, None)
+
+
 def compute_ghost_hands_suggestions(
     text: str,
     genre_data: Dict[str, Any],
@@ -466,30 +733,30 @@ def generate_midi_from_harmony(
         velocity = int(base_velocity + random.uniform(-humanization, humanization))
         velocity = max(1, min(127, velocity))
         
-        # Generate note on/off for each chord tone
-        for interval in intervals:
-            note = base_note + interval
-            
-            # Note On
-            events.append(MidiEvent(
-                status=0x90,  # Note On, channel 1
-                data1=note,
-                data2=velocity,
-                timestamp=timestamp,
-            ))
-        
         # Calculate note duration based on gate
         duration_samples = int(samples_per_beat * knobs.gate)
         
-        # Note Offs
-        for interval in intervals:
-            note = base_note + interval
-            events.append(MidiEvent(
+        # Each chord's events are added in two bulk extends (Note Ons, then
+        # Note Offs) rather than one append per event. midi_events stays a
+        # list: PythonBridge.cpp casts it to py::list.
+        events.extend(
+            MidiEvent(
+                status=0x90,  # Note On, channel 1
+                data1=base_note + interval,
+                data2=velocity,
+                timestamp=timestamp,
+            )
+            for interval in intervals
+        )
+        events.extend(
+            MidiEvent(
                 status=0x80,  # Note Off, channel 1
-                data1=note,
+                data1=base_note + interval,
                 data2=0,
                 timestamp=timestamp + duration_samples,
-            ))
+            )
+            for interval in intervals
+        )
         
         # Move to next beat
         timestamp += samples_per_beat
@@ -18,23 +18,84 @@ This script manages pull requests in the repository by:
 Never force pushes. Never auto-resolves conflicts. Always preserves conflict state.
 
 Usage:
-    python pr_manager.py [--dry-run] [--pr NUMBER]
+    python pr_manager.py [--dry-run] [--pr NUMBER] [--max-parallel N]
     
 Options:
-    --dry-run       Simulate merges without actually committing or pushing
-    --pr NUMBER     Process only a specific PR number
-    --help          Show this help message
+    --dry-run         Simulate merges without actually committing or pushing
+    --pr NUMBER       Process only a specific PR number
+    --max-parallel N  Number of PRs to merge concurrently (default: 4)
+    --help            Show this help message
 """
 
 import os
+import re
+import asyncio
 import sys
+import shutil
 import subprocess
+import tempfile
+import threading
 import json
 import argparse
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+DEFAULT_MAX_PARALLEL = 4
+
+# Resolved once per process; None if the GitHub CLI is not installed
+_GH_BIN = shutil.which("gh")
+# An absolute path lets subprocess use posix_spawn instead of fork
+_GIT_BIN = shutil.which("git") or "git"
+
+# GitHub's server-side verdict that a PR merges cleanly into its base
+GITHUB_MERGEABLE = "MERGEABLE"
+
+# Fixed-layout records where the interpreter supports it (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Malformed PR listings: missing fields or undecodable JSON
+PR_DATA_ERRORS = (KeyError, ValueError) + ((ijson.JSONError,) if IJSON_AVAILABLE else ())
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+OPEN_PRS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100) {
+      nodes { id number title headRefName baseRefName headRefOid mergeable url }
+    }
+  }
+}
+"""
+
+# GitHub accepts up to ~100 aliased mutations in one request
+MAX_COMMENTS_PER_REQUEST = 100
+
+
+def build_add_comments_mutation(count: int) -> str:
+    """Build one GraphQL mutation posting `count` comments via aliases c0..cN."""
+    params = ", ".join(f"$s{i}: ID!, $b{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  c{i}: addComment(input: {{subjectId: $s{i}, body: $b{i}}}) {{ clientMutationId }}"
+        for i in range(count)
+    )
+    return f"mutation({params}) {{\n{fields}\n}}"
+
 
 class MergeStatus(Enum):
     """Status of a merge attempt."""
@@ -43,7 +104,7 @@ class MergeStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PullRequest:
     """Represents a GitHub Pull Request."""
     number: int
@@ -51,23 +112,37 @@ class PullRequest:
     head_ref: str  # Source branch
     base_ref: str  # Target branch
     head_sha: str
-    mergeable: Optional[bool]
+    mergeable: Optional[str]  # MERGEABLE / CONFLICTING / UNKNOWN, as GitHub reports it
     url: str
+    # Set by PRManager.precompute_conflicts: None = not screened,
+    # () = merges cleanly, otherwise the conflicting paths
+    precomputed_conflicts: Optional[Tuple[str, ...]] = None
+    # GraphQL node ID, needed to comment through the API
+    node_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MergeResult:
     """Result of a merge attempt."""
     pr: PullRequest
     status: MergeStatus
     conflicting_files: List[str]
     error_message: Optional[str] = None
+    # In-memory merges: the base tip merged against and the new merge commit
+    base_sha: Optional[str] = None
+    merge_commit: Optional[str] = None
 
 
 class PRManager:
     """Manages pull request merging and conflict resolution."""
 
-    def __init__(self, repo_path: str = ".", dry_run: bool = False, target_pr: Optional[int] = None):
+    def __init__(
+        self,
+        repo_path: str = ".",
+        dry_run: bool = False,
+        target_pr: Optional[int] = None,
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ):
         """
         Initialize the PR manager.
         
@@ -75,42 +150,262 @@ class PRManager:
             repo_path: Path to the git repository (default: current directory)
             dry_run: If True, simulate without actually making changes
             target_pr: If specified, only process this PR number
+            max_parallel: Number of PRs to merge concurrently
         """
         self.repo_path = repo_path
         self.dry_run = dry_run
         self.target_pr = target_pr
+        self.max_parallel = max(1, max_parallel)
         self.results: List[MergeResult] = []
+        # Pushes to a base branch must not race each other
+        self._push_lock = threading.Lock()
+        # Long-lived git processes for ref lookups and ref writes,
+        # started on first use so plain construction spawns nothing
+        self._cat_file: Optional[subprocess.Popen] = None
+        self._update_ref: Optional[subprocess.Popen] = None
+        self._batch_lock = threading.Lock()
+        # Shared GitHub API session, opened on first GraphQL call
+        self._github_client = None
+        # Conflict comments queued for one bulk API request after merging
+        self._pending_comments: List[Tuple[PullRequest, str]] = []
         
         if dry_run:
             print("🔍 DRY RUN MODE - No changes will be made")
             print("="*60)
 
-    def run_git_command(self, args: List[str], check: bool = True) -> Tuple[int, str, str]:
+    def __enter__(self) -> "PRManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the persistent git processes and the GitHub session."""
+        client = getattr(self, "_github_client", None)
+        if client is not None:
+            client.close()
+            self._github_client = None
+        for attr in ("_cat_file", "_update_ref"):
+            proc = getattr(self, attr, None)
+            if proc is not None:
+                if proc.poll() is None:
+                    proc.stdin.close()
+                    proc.wait()
+                setattr(self, attr, None)
+
+    def _batch_process(self, attr: str, args: List[str]) -> subprocess.Popen:
+        """Return a running persistent git process, (re)starting it if needed."""
+        proc = getattr(self, attr)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                [_GIT_BIN, "-C", self.repo_path] + args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                close_fds=False
+            )
+            setattr(self, attr, proc)
+        return proc
+
+    def resolve_ref(self, rev: str) -> Optional[str]:
+        """
+        Resolve a revision to an object id via `git cat-file --batch-check`.
+        
+        Args:
+            rev: Any revision git understands (e.g. "origin/main")
+            
+        Returns:
+            The object id, or None if the revision does not exist
+        """
+        with self._batch_lock:
+            proc = self._batch_process("_cat_file", ["cat-file", "--batch-check"])
+            proc.stdin.write(f"{rev}\n".encode())
+            reply = proc.stdout.readline().decode().split()
+        
+        # "<oid> <type> <size>" on success, "<rev> missing" otherwise
+        if len(reply) == 3:
+            return reply[0]
+        return None
+
+    def create_ref(self, ref: str, oid: str) -> Tuple[bool, str]:
+        """
+        Create a ref via the persistent `git update-ref --stdin` pipe.
+        
+        Fails, like `git branch`, if the ref already exists.
+        
+        Args:
+            ref: Full ref name (e.g. "refs/heads/conflicts/feature")
+            oid: Object id the new ref should point at
+            
+        Returns:
+            Tuple of (success, error message)
+        """
+        with self._batch_lock:
+            proc = self._batch_process("_update_ref", ["update-ref", "--stdin", "-z"])
+            proc.stdin.write(f"start\0create {ref}\0{oid}\0commit\0".encode())
+            proc.stdout.readline()  # "start: ok"
+            if proc.stdout.readline().strip() == b"commit: ok":
+                return True, ""
+            
+            # update-ref exits on a failed transaction; report why
+            proc.wait()
+            self._update_ref = None
+            return False, proc.stderr.read().decode().strip()
+
+    def run_git_command(
+        self,
+        args: List[str],
+        check: bool = True,
+        cwd: Optional[str] = None,
+        binary: bool = False,
+    ) -> Tuple[int, Union[str, bytes], Union[str, bytes]]:
         """
         Run a git command and return the result.
         
+        The working tree is passed as `git -C` rather than `cwd=`, and
+        close_fds is off, so CPython can start git with posix_spawn rather
+        than forking this process. Keeping fds open is safe here: Python
+        creates every fd non-inheritable, so git inherits only its pipes.
+        
         Args:
             args: Git command arguments
             check: Whether to raise exception on non-zero exit
+            cwd: Working tree to run in (default: the repository path)
+            binary: Return stdout/stderr as raw bytes instead of decoding
+                them (for exit-code-only checks and ASCII output)
             
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
-        cmd = ["git", "-C", self.repo_path] + args
+        cmd = [_GIT_BIN, "-C", cwd or self.repo_path] + args
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
-            check=False
+            text=not binary,
+            check=False,
+            close_fds=False
         )
         
         if check and result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace") if binary else result.stderr
             print(f"Git command failed: {' '.join(cmd)}")
             print(f"Exit code: {result.returncode}")
-            print(f"Stderr: {result.stderr}")
+            print(f"Stderr: {stderr}")
             
         return result.returncode, result.stdout.strip(), result.stderr.strip()
 
+    async def run_git_command_async(
+        self,
+        args: List[str],
+        cwd: Optional[str] = None,
+    ) -> Tuple[int, str, str]:
+        """
+        Async counterpart of run_git_command for concurrent bursts.
+        
+        Many of these can be in flight on one event loop without a
+        thread per command. Like run_git_command, git is spawned by
+        absolute path with close_fds off so it can use posix_spawn.
+        
+        Args:
+            args: Git command arguments
+            cwd: Working tree to run in (default: the repository path)
+            
+        Returns:
+            Tuple of (exit_code, stdout, stderr)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            _GIT_BIN, "-C", cwd or self.repo_path, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode, stdout.decode().strip(), stderr.decode().strip()
+
+    @cached_property
+    def remote_url(self) -> Optional[str]:
+        """URL of the origin remote, looked up once per run."""
+        exit_code, stdout, _ = self.run_git_command(
+            ["config", "--get", "remote.origin.url"],
+            check=False
+        )
+        return stdout if exit_code == 0 and stdout else None
+
+    @cached_property
+    def github_repo(self) -> Optional[Tuple[str, str]]:
+        """(owner, name) of the GitHub origin, or None if it is not on GitHub."""
+        if self.remote_url is None:
+            return None
+        match = re.search(r"github\.com[:/]([^/]+)/(.+?)(?:\.git)?/?$", self.remote_url)
+        return (match.group(1), match.group(2)) if match else None
+
+    def graphql(self, query: str, variables: Dict) -> Tuple[Optional[Dict], List[Dict]]:
+        """
+        Run a GraphQL request over the shared GitHub API session.
+        
+        A response can carry both: with aliased mutations, the ones that
+        succeeded are applied and have results in `data` even when others
+        are reported in `errors` (and come back null).
+        
+        Args:
+            query: GraphQL query or mutation
+            variables: Variables for the request
+            
+        Returns:
+            Tuple of (response `data`, response `errors`); data is None if
+            the API is unavailable or the request failed outright
+        """
+        gh_token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        if not HTTPX_AVAILABLE or not gh_token:
+            return None, []
+        
+        if self._github_client is None:
+            self._github_client = httpx.Client(
+                headers={"Authorization": f"bearer {gh_token}"},
+                timeout=30.0
+            )
+        
+        try:
+            response = self._github_client.post(
+                GITHUB_GRAPHQL_URL,
+                json={"query": query, "variables": variables}
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"⚠️  GitHub API request failed: {e}")
+            return None, []
+        
+        errors = payload.get("errors") or []
+        if errors:
+            print(f"⚠️  GitHub API returned errors: {errors}")
+        return payload.get("data"), errors
+
+    @cached_property
+    def remote_branches(self) -> Set[str]:
+        """Branch names on origin, listed once with a single for-each-ref."""
+        _, stdout, _ = self.run_git_command(
+            ["for-each-ref", "--format=%(refname:short)", "refs/remotes/origin"],
+            check=False
+        )
+        prefix = "origin/"
+        return {ref[len(prefix):] for ref in stdout.split("\n") if ref.startswith(prefix)}
+
+    @cached_property
+    def merge_tree_supported(self) -> bool:
+        """Whether git can merge in memory (`merge-tree --write-tree`, Git 2.38+)."""
+        _, stdout, _ = self.run_git_command(["version"], check=False)
+        match = re.search(r"(\d+)\.(\d+)", stdout)
+        return bool(match) and tuple(int(part) for part in match.groups()) >= (2, 38)
+
+    def branch_exists(self, branch: str) -> bool:
+        """Check whether origin has a branch, without spawning git."""
+        return branch in self.remote_branches
+
     def fetch_all(self) -> bool:
         """Fetch all branches from remote."""
         print("📡 Fetching latest changes from remote...")
@@ -150,13 +445,7 @@ class PRManager:
         # Check if gh CLI is available and has token
         gh_token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
         
-        result = subprocess.run(
-            ["which", "gh"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
+        if _GH_BIN is None:
             print("⚠️  GitHub CLI (gh) not found. Please install it to use this script.")
             print("    Visit: https://cli.github.com/")
             return []
@@ -171,50 +460,174 @@ class PRManager:
         env["GH_TOKEN"] = gh_token
         
         # Fetch PRs using gh CLI
-        exit_code, stdout, stderr = self.run_git_command(
-            ["config", "--get", "remote.origin.url"],
-            check=False
-        )
-        
-        if exit_code != 0:
+        if self.remote_url is None:
             print("✗ Could not determine repository URL")
             return []
         
-        # Use gh to list PRs
-        cmd = ["gh", "pr", "list", "--state", "open", "--json", 
-               "number,title,headRefName,baseRefName,headRefOid,mergeable,url"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False, env=env)
+        # One API round-trip when httpx is installed; gh otherwise
+        if HTTPX_AVAILABLE and self.github_repo is not None:
+            owner, name = self.github_repo
+            data, errors = self.graphql(OPEN_PRS_QUERY, {"owner": owner, "name": name})
+            if data is not None and not errors:
+                try:
+                    prs = self._parse_pr_list(data["repository"]["pullRequests"]["nodes"])
+                except PR_DATA_ERRORS as e:
+                    print(f"✗ Failed to parse PR data: {e}")
+                    return []
+                print(f"✓ Found {len(prs)} open pull request(s)")
+                return prs
+        
+        # Use gh to list PRs, building each PR as its JSON streams in
+        # rather than buffering the whole listing first
+        cmd = [_GH_BIN, "pr", "list", "--state", "open", "--json", 
+               "id,number,title,headRefName,baseRefName,headRefOid,mergeable,url"]
+        parse_error = None
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env) as proc:
+            try:
+                prs = self._parse_pr_list(self._iter_json_array(proc.stdout))
+            except PR_DATA_ERRORS as e:
+                prs, parse_error = [], e
+            # Drain stdout so gh never blocks on a full pipe
+            proc.stdout.read()
+            stderr = proc.stderr.read().decode().strip()
         
-        if result.returncode != 0:
-            print(f"✗ Failed to fetch PRs: {result.stderr}")
+        if proc.returncode != 0:
+            print(f"✗ Failed to fetch PRs: {stderr}")
             return []
         
-        try:
-            pr_data = json.loads(result.stdout)
-            prs = [
-                PullRequest(
-                    number=pr["number"],
-                    title=pr["title"],
-                    head_ref=pr["headRefName"],
-                    base_ref=pr["baseRefName"],
-                    head_sha=pr["headRefOid"],
-                    mergeable=pr.get("mergeable"),
-                    url=pr["url"]
-                )
-                for pr in pr_data
-            ]
-            print(f"✓ Found {len(prs)} open pull request(s)")
-            return prs
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"✗ Failed to parse PR data: {e}")
+        if parse_error is not None:
+            print(f"✗ Failed to parse PR data: {parse_error}")
             return []
+        
+        print(f"✓ Found {len(prs)} open pull request(s)")
+        return prs
+
+    @staticmethod
+    def _iter_json_array(stream: IO[bytes]) -> Iterator[Dict]:
+        """Yield the items of a JSON array, incrementally if ijson is installed."""
+        if IJSON_AVAILABLE:
+            yield from ijson.items(stream, "item")
+        else:
+            yield from json.load(stream)
+
+    @staticmethod
+    def _parse_pr_list(pr_data: Iterable[Dict]) -> List[PullRequest]:
+        """Build PullRequest objects from `gh pr list` / GraphQL PR nodes."""
+        return [
+            PullRequest(
+                number=pr["number"],
+                title=pr["title"],
+                head_ref=pr["headRefName"],
+                base_ref=pr["baseRefName"],
+                head_sha=pr["headRefOid"],
+                mergeable=pr.get("mergeable"),
+                url=pr["url"],
+                node_id=pr.get("id")
+            )
+            for pr in pr_data
+        ]
+
+    def merge_tree(self, base: str, head: str) -> Tuple[int, str, List[str]]:
+        """
+        Merge two revisions in memory with `git merge-tree --write-tree`.
+        
+        Args:
+            base: Revision being merged into
+            head: Revision being merged
+            
+        Returns:
+            Tuple of (exit_code, tree_oid, conflicting_files). Exit code 0
+            is a clean merge, 1 a conflicted one (tree_oid is then the tree
+            with conflict markers); anything else means the merge could not
+            be attempted and tree_oid is empty.
+        """
+        exit_code, stdout, _ = self.run_git_command(
+            self._merge_tree_args(base, head),
+            check=False
+        )
+        return self._parse_merge_tree(exit_code, stdout)
+
+    @staticmethod
+    def _merge_tree_args(base: str, head: str) -> List[str]:
+        return ["merge-tree", "--write-tree", "--name-only", "--no-messages", base, head]
+
+    @staticmethod
+    def _parse_merge_tree(exit_code: int, stdout: str) -> Tuple[int, str, List[str]]:
+        """Split merge-tree output into (exit_code, tree_oid, conflicting_files)."""
+        lines = stdout.split("\n") if stdout else []
+        if exit_code not in (0, 1) or not lines:
+            return 2, "", []
+        
+        # First line is the tree OID; the rest are conflicted paths
+        conflicts = list(dict.fromkeys(line for line in lines[1:] if line))
+        return exit_code, lines[0], conflicts
 
-    def attempt_merge(self, pr: PullRequest) -> MergeResult:
+    def precompute_conflicts(self, prs: List[PullRequest]) -> List[PullRequest]:
+        """
+        Screen PRs for conflicts with in-memory merges.
+        
+        Runs one `git merge-tree --write-tree` (Git 2.38+) per PR, all
+        supervised by a single asyncio event loop with at most
+        max_parallel in flight, and records the result in
+        `precomputed_conflicts`.
+        PRs GitHub already reports as MERGEABLE are marked clean without
+        a local merge; CONFLICTING and not-yet-computed ones are screened
+        so the conflicting paths are known.
+        The working tree is never touched. PRs that cannot be screened
+        (older Git, missing refs) are left as None and merged normally.
+        
+        Args:
+            prs: Pull requests to screen
+            
+        Returns:
+            The same PRs, in order, with precomputed_conflicts filled in
+        """
+        if not self.merge_tree_supported:
+            return prs
+        
+        async def screen_all() -> List[Optional[Tuple[str, ...]]]:
+            semaphore = asyncio.Semaphore(self.max_parallel)
+            
+            async def screen(pr: PullRequest) -> Optional[Tuple[str, ...]]:
+                if not (self.branch_exists(pr.base_ref) and self.branch_exists(pr.head_ref)):
+                    return None
+                if pr.mergeable == GITHUB_MERGEABLE:
+                    return ()
+                async with semaphore:
+                    exit_code, stdout, _ = await self.run_git_command_async(
+                        self._merge_tree_args(f"origin/{pr.base_ref}", f"origin/{pr.head_ref}")
+                    )
+                exit_code, _, conflicts = self._parse_merge_tree(exit_code, stdout)
+                return tuple(conflicts) if exit_code in (0, 1) else None
+            
+            return await asyncio.gather(*(screen(pr) for pr in prs))
+        
+        return [
+            replace(pr, precomputed_conflicts=conflicts)
+            for pr, conflicts in zip(prs, asyncio.run(screen_all()))
+        ]
+
+    def attempt_merge(
+        self,
+        pr: PullRequest,
+        worktree_path: Optional[str] = None,
+        onto: Optional[str] = None,
+    ) -> MergeResult:
         """
         Attempt to merge a pull request.
         
+        With Git 2.38+ and no worktree, the merge happens entirely in
+        memory and no working tree is touched. Otherwise it is performed
+        with a real checkout + merge.
+        
         Args:
             pr: Pull request to merge
+            worktree_path: Isolated worktree already detached at
+                origin/{base_ref}. If None and in-memory merging is not
+                available, the shared working tree is used and the target
+                branch is checked out and pulled first.
+            onto: Commit to merge onto instead of origin/{base_ref}
+                (in-memory merges only)
             
         Returns:
             MergeResult with status and details
@@ -224,36 +637,52 @@ class PRManager:
         print(f"  Source: {pr.head_ref} → Target: {pr.base_ref}")
         print(f"{'='*60}")
         
-        # Ensure we're on the target branch
-        print(f"🔄 Checking out target branch: {pr.base_ref}")
-        exit_code, _, stderr = self.run_git_command(
-            ["checkout", pr.base_ref],
-            check=False
-        )
+        cwd = worktree_path or self.repo_path
         
-        if exit_code != 0:
+        if pr.precomputed_conflicts:
+            # Already known to conflict; nothing to check out or abort
+            print("⚠️  Merge conflicts detected (pre-screened)")
             return MergeResult(
                 pr=pr,
-                status=MergeStatus.ERROR,
-                conflicting_files=[],
-                error_message=f"Failed to checkout target branch: {stderr}"
+                status=MergeStatus.CONFLICT,
+                conflicting_files=list(pr.precomputed_conflicts)
             )
         
-        # Pull latest changes on target branch
-        print(f"⬇️  Pulling latest changes on {pr.base_ref}")
-        exit_code, _, stderr = self.run_git_command(
-            ["pull", "origin", pr.base_ref],
-            check=False
-        )
+        if worktree_path is None and self.merge_tree_supported:
+            return self._merge_in_memory(pr, onto)
         
-        if exit_code != 0:
-            print(f"⚠️  Warning: Could not pull latest changes: {stderr}")
+        if worktree_path is None:
+            # Ensure we're on the target branch
+            print(f"🔄 Checking out target branch: {pr.base_ref}")
+            exit_code, _, stderr = self.run_git_command(
+                ["checkout", pr.base_ref],
+                check=False
+            )
+            
+            if exit_code != 0:
+                return MergeResult(
+                    pr=pr,
+                    status=MergeStatus.ERROR,
+                    conflicting_files=[],
+                    error_message=f"Failed to checkout target branch: {stderr}"
+                )
+            
+            # Pull latest changes on target branch
+            print(f"⬇️  Pulling latest changes on {pr.base_ref}")
+            exit_code, _, stderr = self.run_git_command(
+                ["pull", "origin", pr.base_ref],
+                check=False
+            )
+            
+            if exit_code != 0:
+                print(f"⚠️  Warning: Could not pull latest changes: {stderr}")
         
         # Attempt merge
         print(f"🔀 Attempting to merge {pr.head_ref} into {pr.base_ref}")
         exit_code, stdout, stderr = self.run_git_command(
             ["merge", "--no-ff", "--no-commit", f"origin/{pr.head_ref}"],
-            check=False
+            check=False,
+            cwd=cwd
         )
         
         if exit_code == 0:
@@ -263,12 +692,14 @@ class PRManager:
             # Check if there are any changes
             exit_code, stdout, _ = self.run_git_command(
                 ["diff", "--cached", "--name-only"],
-                check=False
+                check=False,
+                cwd=cwd,
+                binary=True
             )
             
             if not stdout:
                 print("ℹ️  No changes to merge")
-                self.run_git_command(["merge", "--abort"], check=False)
+                self.run_git_command(["merge", "--abort"], check=False, cwd=cwd)
                 return MergeResult(
                     pr=pr,
                     status=MergeStatus.SUCCESS,
@@ -280,7 +711,8 @@ class PRManager:
             print("📝 Completing merge...")
             exit_code, _, stderr = self.run_git_command(
                 ["commit", "-m", f"Merge pull request #{pr.number}: {pr.title}"],
-                check=False
+                check=False,
+                cwd=cwd
             )
             
             if exit_code != 0:
@@ -304,7 +736,8 @@ class PRManager:
                 # Get list of conflicting files
                 exit_code, conflicts_output, _ = self.run_git_command(
                     ["diff", "--name-only", "--diff-filter=U"],
-                    check=False
+                    check=False,
+                    cwd=cwd
                 )
                 
                 conflicting_files = conflicts_output.split("\n") if conflicts_output else []
@@ -328,12 +761,114 @@ class PRManager:
                     error_message=f"Merge failed: {stderr}"
                 )
 
-    def handle_successful_merge(self, result: MergeResult) -> bool:
+    def _merge_in_memory(self, pr: PullRequest, onto: Optional[str] = None) -> MergeResult:
+        """
+        Merge a PR with merge-tree + commit-tree, without any checkout.
+        
+        The resulting merge commit is only created as an object; it is
+        published by handle_successful_merge or publish_stack.
+        
+        Args:
+            pr: Pull request to merge
+            onto: Commit to merge onto (default: origin/{base_ref})
+            
+        Returns:
+            MergeResult with status and details
+        """
+        base_sha = onto or self.resolve_ref(f"origin/{pr.base_ref}")
+        head_sha = self.resolve_ref(f"origin/{pr.head_ref}")
+        if base_sha is None or head_sha is None:
+            return MergeResult(
+                pr=pr,
+                status=MergeStatus.ERROR,
+                conflicting_files=[],
+                error_message=f"Could not resolve origin/{pr.base_ref} or origin/{pr.head_ref}"
+            )
+        
+        print(f"🔀 Attempting to merge {pr.head_ref} into {pr.base_ref}")
+        exit_code, tree, conflicting_files = self.merge_tree(base_sha, head_sha)
+        
+        if exit_code == 1:
+            print("⚠️  Merge conflicts detected")
+            print(f"   Conflicting files ({len(conflicting_files)}):")
+            for file in conflicting_files:
+                print(f"     - {file}")
+            
+            return MergeResult(
+                pr=pr,
+                status=MergeStatus.CONFLICT,
+                conflicting_files=conflicting_files,
+                base_sha=base_sha
+            )
+        
+        if exit_code != 0:
+            return MergeResult(
+                pr=pr,
+                status=MergeStatus.ERROR,
+                conflicting_files=[],
+                error_message="Merge failed: git merge-tree could not merge the branches"
+            )
+        
+        print("✓ Merge succeeded without conflicts")
+        
+        if tree == self.resolve_ref(f"{base_sha}^{{tree}}"):
+            print("ℹ️  No changes to merge")
+            return MergeResult(
+                pr=pr,
+                status=MergeStatus.SUCCESS,
+                conflicting_files=[],
+                error_message="No changes to merge",
+                base_sha=base_sha
+            )
+        
+        print("📝 Completing merge...")
+        exit_code, merge_commit, stderr = self.run_git_command(
+            ["commit-tree", tree, "-p", base_sha, "-p", head_sha,
+             "-m", f"Merge pull request #{pr.number}: {pr.title}"],
+            check=False
+        )
+        
+        if exit_code != 0:
+            return MergeResult(
+                pr=pr,
+                status=MergeStatus.ERROR,
+                conflicting_files=[],
+                error_message=f"Failed to commit merge: {stderr}"
+            )
+        
+        return MergeResult(
+            pr=pr,
+            status=MergeStatus.SUCCESS,
+            conflicting_files=[],
+            base_sha=base_sha,
+            merge_commit=merge_commit
+        )
+
+    def _base_moved(self, result: MergeResult, worktree_path: Optional[str] = None) -> bool:
+        """Check whether origin/{base_ref} advanced since the merge was computed."""
+        pr = result.pr
+        if result.base_sha is not None:
+            return result.base_sha != self.resolve_ref(f"origin/{pr.base_ref}")
+        
+        exit_code, _, _ = self.run_git_command(
+            ["merge-base", "--is-ancestor", f"origin/{pr.base_ref}", "HEAD"],
+            check=False,
+            cwd=worktree_path,
+            binary=True
+        )
+        return exit_code != 0
+
+    def handle_successful_merge(
+        self,
+        result: MergeResult,
+        worktree_path: Optional[str] = None,
+    ) -> bool:
         """
         Handle a successful merge by pushing and deleting the source branch.
         
         Args:
             result: Successful merge result
+            worktree_path: Worktree holding the merge commit, if any
             
         Returns:
             True if handling succeeded, False otherwise
@@ -346,11 +881,19 @@ class PRManager:
             print(f"🔍 DRY RUN: Would delete branch {pr.head_ref}")
             return True
         
-        # Push the merge to remote
+        # Push the merge to remote. In-memory merges exist only as a
+        # commit object and worktrees hold theirs on a detached HEAD.
         print(f"⬆️  Pushing merge to origin/{pr.base_ref}")
+        if result.base_sha is not None:
+            refspec = f"{result.merge_commit or result.base_sha}:refs/heads/{pr.base_ref}"
+        elif worktree_path:
+            refspec = f"HEAD:refs/heads/{pr.base_ref}"
+        else:
+            refspec = pr.base_ref
         exit_code, _, stderr = self.run_git_command(
-            ["push", "origin", pr.base_ref],
-            check=False
+            ["push", "origin", refspec],
+            check=False,
+            cwd=worktree_path
         )
         
         if exit_code != 0:
@@ -374,12 +917,65 @@ class PRManager:
         print(f"✓ Source branch {pr.head_ref} deleted")
         return True
 
-    def handle_conflicted_merge(self, result: MergeResult) -> bool:
+    def publish_stack(self, base_ref: str, tip: str, results: List[MergeResult]) -> bool:
+        """
+        Publish a stack of in-memory merges with a single push.
+        
+        Args:
+            base_ref: Target branch the stack was built on
+            tip: Final commit of the stack
+            results: Successful merge results in the stack, in order
+            
+        Returns:
+            True if the stack was pushed, False otherwise
+        """
+        head_refs = [result.pr.head_ref for result in results]
+        print(f"\n✅ Publishing {len(results)} merge(s) to {base_ref}")
+        for result in results:
+            print(f"  - PR #{result.pr.number}: {result.pr.title}")
+        
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would push merge to origin/{base_ref}")
+            print(f"🔍 DRY RUN: Would delete branch(es) {', '.join(head_refs)}")
+            return True
+        
+        print(f"⬆️  Pushing merge to origin/{base_ref}")
+        exit_code, _, stderr = self.run_git_command(
+            ["push", "origin", f"{tip}:refs/heads/{base_ref}"],
+            check=False
+        )
+        
+        if exit_code != 0:
+            print(f"✗ Failed to push merge: {stderr}")
+            return False
+        
+        print("✓ Merge pushed successfully")
+        
+        print(f"🗑️  Deleting source branch(es): {', '.join(head_refs)}")
+        exit_code, _, stderr = self.run_git_command(
+            ["push", "origin", "--delete"] + head_refs,
+            check=False
+        )
+        
+        if exit_code != 0:
+            print(f"⚠️  Warning: Could not delete remote branch(es): {stderr}")
+            print(f"   You may need to manually delete {', '.join(head_refs)}")
+            return True  # Still consider this a success
+        
+        print(f"✓ Source branch(es) deleted")
+        return True
+
+    def handle_conflicted_merge(
+        self,
+        result: MergeResult,
+        worktree_path: Optional[str] = None,
+    ) -> bool:
         """
         Handle a conflicted merge by creating a conflicts branch.
         
         Args:
             result: Conflicted merge result
+            worktree_path: Worktree holding the conflicted merge, if any
             
         Returns:
             True if handling succeeded, False otherwise
@@ -389,9 +985,11 @@ class PRManager:
         
         print(f"\n⚠️  Handling merge conflicts for PR #{pr.number}")
         
-        # Abort the current merge
-        print("🔄 Aborting conflicted merge...")
-        self.run_git_command(["merge", "--abort"], check=False)
+        # Abort the current merge (in-memory and pre-screened conflicts
+        # never started one)
+        if result.base_sha is None and not pr.precomputed_conflicts:
+            print("🔄 Aborting conflicted merge...")
+            self.run_git_command(["merge", "--abort"], check=False, cwd=worktree_path)
         
         if self.dry_run:
             print(f"🔍 DRY RUN: Would create conflicts branch: {conflicts_branch}")
@@ -402,14 +1000,15 @@ class PRManager:
         # Create conflicts branch
         print(f"🌿 Creating conflicts branch: {conflicts_branch}")
         
-        # First, checkout the source branch
-        exit_code, _, stderr = self.run_git_command(
-            ["checkout", "-b", conflicts_branch, f"origin/{pr.head_ref}"],
-            check=False
-        )
+        # Point it at the source branch without touching any working tree
+        head_sha = self.resolve_ref(f"origin/{pr.head_ref}")
+        if head_sha is None:
+            print(f"✗ Failed to create conflicts branch: origin/{pr.head_ref} not found")
+            return False
         
-        if exit_code != 0:
-            print(f"✗ Failed to create conflicts branch: {stderr}")
+        created, error = self.create_ref(f"refs/heads/{conflicts_branch}", head_sha)
+        if not created:
+            print(f"✗ Failed to create conflicts branch: {error}")
             return False
         
         # Push the conflicts branch
@@ -429,35 +1028,32 @@ class PRManager:
         print(f"💬 Adding comment to PR about conflicts")
         self.comment_on_pr(pr, result.conflicting_files)
         
-        # Return to base branch
-        self.run_git_command(["checkout", pr.base_ref], check=False)
-        
         return True
 
     def comment_on_pr(self, pr: PullRequest, conflicting_files: List[str]) -> bool:
         """
         Add a comment to a PR about merge conflicts.
         
+        Comments that can go through the GitHub API are queued and posted
+        together by flush_comments(); otherwise gh posts them immediately.
+        
         Args:
             pr: Pull request
             conflicting_files: List of files with conflicts
             
         Returns:
-            True if comment added successfully, False otherwise
+            True if comment added or queued successfully, False otherwise
         """
         conflicts_branch = f"conflicts/{pr.head_ref}"
         
-        # Build comment text
+        # Build comment text in one join so large conflict lists stay linear
+        file_list = "".join(f"- `{file}`\n" for file in conflicting_files)
         comment = f"""## ⚠️ Merge Conflicts Detected
 
 This PR cannot be automatically merged due to conflicts with the target branch `{pr.base_ref}`.
 
 ### Conflicting Files ({len(conflicting_files)}):
-"""
-        for file in conflicting_files:
-            comment += f"- `{file}`\n"
-        
-        comment += f"""
+{file_list}
 ### Next Steps:
 1. A conflicts branch has been created: `{conflicts_branch}`
 2. Review the conflicts in the files listed above
@@ -475,12 +1071,28 @@ The conflicts branch preserves the current state for your review.
             print(comment)
             return False
         
+        # Prefer the shared API session over spawning gh
+        if HTTPX_AVAILABLE and pr.node_id:
+            self._pending_comments.append((pr, comment))
+            print("✓ Comment queued for PR")
+            return True
+        
+        return self._comment_via_gh(pr, comment, gh_token)
+
+    def _comment_via_gh(self, pr: PullRequest, comment: str, gh_token: str) -> bool:
+        """Post one comment with `gh pr comment`."""
+        if _GH_BIN is None:
+            print("⚠️  Cannot add comment: GitHub CLI (gh) not found")
+            print("   Comment text:")
+            print(comment)
+            return False
+        
         # Use gh CLI to add comment
         env = os.environ.copy()
         env["GH_TOKEN"] = gh_token
         
         result = subprocess.run(
-            ["gh", "pr", "comment", str(pr.number), "--body", comment],
+            [_GH_BIN, "pr", "comment", str(pr.number), "--body", comment],
             capture_output=True,
             text=True,
             check=False,
@@ -496,15 +1108,215 @@ The conflicts branch preserves the current state for your review.
             print(comment)
             return False
 
+    def flush_comments(self) -> None:
+        """
+        Post all queued conflict comments.
+        
+        Sends one aliased GraphQL mutation per MAX_COMMENTS_PER_REQUEST
+        comments. Comments whose alias came back null (or the whole batch,
+        if the request failed) are retried one by one through gh.
+        """
+        pending, self._pending_comments = self._pending_comments, []
+        if not pending:
+            return
+        
+        print(f"\n💬 Posting {len(pending)} conflict comment(s)")
+        gh_token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        
+        for start in range(0, len(pending), MAX_COMMENTS_PER_REQUEST):
+            batch = pending[start:start + MAX_COMMENTS_PER_REQUEST]
+            variables = {}
+            for i, (pr, comment) in enumerate(batch):
+                variables[f"s{i}"] = pr.node_id
+                variables[f"b{i}"] = comment
+            
+            data, _ = self.graphql(build_add_comments_mutation(len(batch)), variables)
+            
+            # Aliases that went through have a result; only the rest (or the
+            # whole batch, if nothing came back) are retried through gh
+            for i, (pr, comment) in enumerate(batch):
+                if data is not None and data.get(f"c{i}") is not None:
+                    print(f"✓ Comment added to PR #{pr.number}")
+                else:
+                    self._comment_via_gh(pr, comment, gh_token)
+
+    def _missing_branch_result(self, pr: PullRequest) -> Optional[MergeResult]:
+        """Return an ERROR result if the PR's base or head is not on origin."""
+        for branch in (pr.base_ref, pr.head_ref):
+            if not self.branch_exists(branch):
+                return MergeResult(
+                    pr=pr,
+                    status=MergeStatus.ERROR,
+                    conflicting_files=[],
+                    error_message=f"Branch not found on origin: {branch}"
+                )
+        return None
+
+    def merge_stacked(self, prs: List[PullRequest]) -> List[MergeResult]:
+        """
+        Merge PRs in memory as one stack per base branch.
+        
+        Each PR is merged onto the result of the PRs before it, so PRs
+        are checked against each other as well as the base, in order. A
+        conflicting PR is dropped and the rest of the stack carries on
+        from the last good commit. Each stack is then published with a
+        single push. Requires Git 2.38+.
+        
+        Args:
+            prs: Pull requests to merge, in merge order
+            
+        Returns:
+            MergeResults in the same order as prs
+        """
+        results: Dict[int, MergeResult] = {}
+        stacks: Dict[str, List[PullRequest]] = {}
+        
+        for pr in prs:
+            result = self._missing_branch_result(pr)
+            if result is None and pr.precomputed_conflicts:
+                # Conflicts with the base itself; no need to stack it
+                result = self.attempt_merge(pr)
+                self.handle_conflicted_merge(result)
+            if result is None:
+                stacks.setdefault(pr.base_ref, []).append(pr)
+            else:
+                if result.status == MergeStatus.ERROR:
+                    print(f"❌ Error processing PR #{pr.number}: {result.error_message}")
+                results[pr.number] = result
+        
+        for base_ref, stack in stacks.items():
+            tip = self.resolve_ref(f"origin/{base_ref}")
+            merged: List[MergeResult] = []
+            
+            for pr in stack:
+                result = self.attempt_merge(pr, onto=tip)
+                results[pr.number] = result
+                
+                if result.status == MergeStatus.SUCCESS:
+                    tip = result.merge_commit or tip
+                    merged.append(result)
+                elif result.status == MergeStatus.CONFLICT:
+                    self.handle_conflicted_merge(result)
+                else:
+                    print(f"❌ Error processing PR: {result.error_message}")
+            
+            if merged:
+                self.publish_stack(base_ref, tip, merged)
+        
+        return [results[pr.number] for pr in prs]
+
+    def process_concurrently(self, prs: List[PullRequest]) -> List[MergeResult]:
+        """
+        Process PRs in parallel worker threads, one worktree each.
+        
+        Used when git cannot merge in memory (older than 2.38).
+        
+        Args:
+            prs: Pull requests to process
+            
+        Returns:
+            MergeResults in the same order as prs
+        """
+        results: Dict[int, MergeResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            futures = {executor.submit(self._process_one_pr, pr): pr for pr in prs}
+            for future in as_completed(futures):
+                pr = futures[future]
+                try:
+                    results[pr.number] = future.result()
+                except Exception as e:
+                    results[pr.number] = MergeResult(
+                        pr=pr,
+                        status=MergeStatus.ERROR,
+                        conflicting_files=[],
+                        error_message=str(e)
+                    )
+        return [results[pr.number] for pr in prs]
+
+    def _process_one_pr(self, pr: PullRequest) -> MergeResult:
+        """
+        Merge one PR and handle the outcome.
+        
+        Merges run in memory when git supports it, otherwise in a private
+        worktree so concurrent workers never share an index.
+        
+        Args:
+            pr: Pull request to process
+            
+        Returns:
+            MergeResult with status and details
+        """
+        result = self._missing_branch_result(pr)
+        if result is not None:
+            return result
+        
+        if pr.precomputed_conflicts:
+            # Known conflicts are handled purely through refs; no worktree
+            result = self.attempt_merge(pr)
+            self.handle_conflicted_merge(result)
+            return result
+        
+        worktree_path = None
+        if not self.merge_tree_supported:
+            worktree_path = tempfile.mkdtemp(prefix=f"pr_manager_{pr.number}_")
+            exit_code, _, stderr = self.run_git_command(
+                ["worktree", "add", "--detach", worktree_path, f"origin/{pr.base_ref}"],
+                check=False
+            )
+            if exit_code != 0:
+                shutil.rmtree(worktree_path, ignore_errors=True)
+                return MergeResult(
+                    pr=pr,
+                    status=MergeStatus.ERROR,
+                    conflicting_files=[],
+                    error_message=f"Failed to create worktree: {stderr}"
+                )
+        
+        try:
+            result = self.attempt_merge(pr, worktree_path)
+            
+            if result.status == MergeStatus.SUCCESS:
+                with self._push_lock:
+                    # Another worker may have landed a merge on the same base
+                    if self._base_moved(result, worktree_path):
+                        print(f"🔄 {pr.base_ref} moved; re-merging PR #{pr.number}")
+                        if worktree_path:
+                            self.run_git_command(
+                                ["reset", "--hard", f"origin/{pr.base_ref}"],
+                                check=False,
+                                cwd=worktree_path
+                            )
+                        result = self.attempt_merge(pr, worktree_path)
+                    
+                    if result.status == MergeStatus.SUCCESS:
+                        self.handle_successful_merge(result, worktree_path)
+            
+            if result.status == MergeStatus.CONFLICT:
+                self.handle_conflicted_merge(result, worktree_path)
+            elif result.status == MergeStatus.ERROR:
+                print(f"❌ Error processing PR: {result.error_message}")
+            
+            return result
+        finally:
+            if worktree_path:
+                self.run_git_command(
+                    ["worktree", "remove", "--force", worktree_path],
+                    check=False
+                )
+                shutil.rmtree(worktree_path, ignore_errors=True)
+
     def print_summary(self):
         """Print a summary of all merge results."""
         print("\n" + "="*60)
         print("MERGE SUMMARY")
         print("="*60)
         
-        successful = [r for r in self.results if r.status == MergeStatus.SUCCESS]
-        conflicted = [r for r in self.results if r.status == MergeStatus.CONFLICT]
-        errored = [r for r in self.results if r.status == MergeStatus.ERROR]
+        buckets: Dict[MergeStatus, List[MergeResult]] = {status: [] for status in MergeStatus}
+        for result in self.results:
+            buckets[result.status].append(result)
+        successful = buckets[MergeStatus.SUCCESS]
+        conflicted = buckets[MergeStatus.CONFLICT]
+        errored = buckets[MergeStatus.ERROR]
         
         print(f"\n✅ Successfully merged and deleted ({len(successful)}):")
         if successful:
@@ -559,17 +1371,17 @@ The conflicts branch preserves the current state for your review.
                 return 1
             print(f"\n🎯 Processing only PR #{self.target_pr}")
         
-        # Process each PR
-        for pr in prs:
-            result = self.attempt_merge(pr)
-            self.results.append(result)
+        try:
+            # Screen everything up front so conflicted PRs skip the merge
+            prs = self.precompute_conflicts(prs)
             
-            if result.status == MergeStatus.SUCCESS:
-                self.handle_successful_merge(result)
-            elif result.status == MergeStatus.CONFLICT:
-                self.handle_conflicted_merge(result)
-            elif result.status == MergeStatus.ERROR:
-                print(f"❌ Error processing PR: {result.error_message}")
+            if self.merge_tree_supported:
+                self.results.extend(self.merge_stacked(prs))
+            else:
+                self.results.extend(self.process_concurrently(prs))
+        finally:
+            self.flush_comments()
+            self.close()
         
         # Print summary
         self.print_summary()
@@ -577,8 +1389,8 @@ The conflicts branch preserves the current state for your review.
         return 0
 
 
-def main():
-    """Main entry point."""
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for the PR manager."""
     parser = argparse.ArgumentParser(
         description="PR Management Agent - Automatically merge or handle conflicts for open PRs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -588,6 +1400,7 @@ Examples:
   python pr_manager.py --dry-run          # Simulate without making changes
   python pr_manager.py --pr 42            # Process only PR #42
   python pr_manager.py --dry-run --pr 42  # Dry run for PR #42
+  python pr_manager.py --max-parallel 8   # Merge up to 8 PRs at once
 
 Environment:
   GH_TOKEN or GITHUB_TOKEN must be set for GitHub API access
@@ -607,14 +1420,31 @@ Environment:
         help="Process only this specific PR number"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        metavar="N",
+        help=f"Number of PRs to merge concurrently (default: {DEFAULT_MAX_PARALLEL})"
+    )
+    
+    return parser
+
+
+def main():
+    """Main entry point."""
+    args = build_arg_parser().parse_args()
     
     # Check if we're in a git repository
     if not os.path.exists(".git"):
         print("❌ Not a git repository. Please run this script from the repository root.")
         return 1
     
-    manager = PRManager(dry_run=args.dry_run, target_pr=args.pr)
+    manager = PRManager(
+        dry_run=args.dry_run,
+        target_pr=args.pr,
+        max_parallel=args.max_parallel
+    )
     return manager.run()
 
 
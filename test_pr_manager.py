@@ -2,277 +2,490 @@
 """
 Test suite for PR Manager
 
-This script tests the PR manager functionality in a controlled environment.
+Tests the PR manager functionality in a controlled environment.
+The tests are independent, so they can be sharded across cores with
+pytest-xdist (`pytest -n auto test_pr_manager.py`) when it is installed.
+
+Run with: pytest test_pr_manager.py, or python test_pr_manager.py
 """
 
-import os
 import sys
-import tempfile
-import shutil
+import importlib
 import subprocess
+from dataclasses import replace
 from pathlib import Path
 
+import pytest
+
+
+# Directory where this script (and pr_manager.py) is located; added to
+# sys.path once, not per test, so repeated runs don't grow the path
+SCRIPT_DIR = Path(__file__).parent.absolute()
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+
+@pytest.fixture(scope="session")
+def pr_manager_module():
+    """Import pr_manager once per session (once per xdist worker)."""
+    return importlib.import_module("pr_manager")
+
+
+# Repo bootstrap chained into one shell spawn instead of five git spawns
+# (double quotes and && work in both sh and cmd.exe)
+GIT_BOOTSTRAP = " && ".join([
+    "git init -q",
+    'git config user.name "Test User"',
+    "git config user.email test@example.com",
+    "git add README.md",
+    'git commit -q -m "Initial commit"',
+])
+
+
+@pytest.fixture(scope="session")
+def tmp_git_repo(tmp_path_factory):
+    """
+    Create a temporary test repository, shared by the session.
+
+    Tests only read from it and address it by path (never via chdir), so
+    one copy suffices; pytest removes it with the rest of the session's
+    basetemp rather than per test.
+    """
+    repo = tmp_path_factory.mktemp("pr_manager_test_")
+    (repo / "README.md").write_text("# Test Repo\n")
+    # Only stderr is kept (for the CalledProcessError); stdout is discarded
+    subprocess.run(
+        GIT_BOOTSTRAP, shell=True, check=True, cwd=repo,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+    return repo
+
+
+def _git(cwd, *args):
+    """Run git in cwd and return its stripped stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit_file(repo, name, text, message):
+    (repo / name).write_text(text)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", message)
+
+
+# PR number -> head branch; all of them target main
+PR_BRANCHES = {1: "clean", 2: "base-conflict", 3: "stack-a", 4: "stack-b"}
+
+
+@pytest.fixture
+def origin_clone(tmp_path):
+    """
+    Clone of a bare origin.git holding one PR branch per merge outcome.
+
+    Off the initial commit, `clean` adds a file, `base-conflict` edits
+    shared.txt (which main then edits too), and `stack-a` and `stack-b`
+    both add pair.txt: each merges cleanly on its own, but not after
+    the other.
+    """
+    origin = tmp_path / "origin.git"
+    seed = tmp_path / "seed"
+    clone = tmp_path / "clone"
+    _git(tmp_path, "init", "-q", "--bare", "-b", "main", str(origin))
+    _git(tmp_path, "init", "-q", "-b", "main", str(seed))
+    _git(seed, "config", "user.name", "Test User")
+    _git(seed, "config", "user.email", "test@example.com")
+
+    _commit_file(seed, "shared.txt", "line\n", "Initial commit")
+    for branch, name, text in [
+        ("clean", "clean.txt", "clean\n"),
+        ("base-conflict", "shared.txt", "feature\n"),
+        ("stack-a", "pair.txt", "a\n"),
+        ("stack-b", "pair.txt", "b\n"),
+    ]:
+        _git(seed, "checkout", "-q", "-b", branch, "main")
+        _commit_file(seed, name, text, f"Change {name} on {branch}")
+    _git(seed, "checkout", "-q", "main")
+    _commit_file(seed, "shared.txt", "main\n", "Edit shared.txt on main")
+    _git(seed, "push", "-q", str(origin), "main", *PR_BRANCHES.values())
+
+    _git(tmp_path, "clone", "-q", str(origin), str(clone))
+    _git(clone, "config", "user.name", "Test User")
+    _git(clone, "config", "user.email", "test@example.com")
+    return clone
+
+
+def _origin_heads(clone):
+    """Branch name -> commit for every branch on the clone's origin."""
+    lines = _git(
+        clone.parent / "origin.git",
+        "for-each-ref", "--format=%(refname:lstrip=2) %(objectname)", "refs/heads"
+    )
+    return dict(line.split(" ") for line in lines.splitlines())
+
+
+def _make_prs(module, clone):
+    return [
+        module.PullRequest(
+            number=number, title=f"PR {number}", head_ref=branch, base_ref="main",
+            head_sha=_git(clone, "rev-parse", f"origin/{branch}"), mergeable=None,
+            url=f"https://github.com/test/test/pull/{number}"
+        )
+        for number, branch in PR_BRANCHES.items()
+    ]
+
+
+def _assert_published(clone, before, merged, conflicted):
+    """Check origin after merging `merged` and parking `conflicted` PRs."""
+    origin = clone.parent / "origin.git"
+    heads = _origin_heads(clone)
+    assert set(heads) == (
+        {"main"}
+        | {PR_BRANCHES[n] for n in conflicted}
+        | {f"conflicts/{PR_BRANCHES[n]}" for n in conflicted}
+    )
+    for number in conflicted:
+        branch = PR_BRANCHES[number]
+        assert heads[branch] == heads[f"conflicts/{branch}"] == before[branch]
+
+    subjects = _git(origin, "log", "--first-parent", "--format=%s", "main").splitlines()
+    assert subjects == [f"Merge pull request #{n}: PR {n}" for n in reversed(merged)] + [
+        "Edit shared.txt on main", "Initial commit"
+    ]
+    assert _git(origin, "show", "main:shared.txt") == "main"
+    assert _git(origin, "show", "main:pair.txt") == "a"
+    assert _git(origin, "show", "main:clean.txt") == "clean"
+
+
+@pytest.fixture
+def git_session(pr_manager_module, tmp_git_repo):
+    """PRManager on the test repo; its persistent git processes are torn down after."""
+    with pr_manager_module.PRManager(repo_path=str(tmp_git_repo)) as manager:
+        yield manager
+
+
+def test_import(pr_manager_module):
+    """Test that pr_manager can be imported."""
+    assert pr_manager_module.__name__ == "pr_manager"
+
+
+def test_classes(pr_manager_module):
+    """Test that required classes exist."""
+    assert hasattr(pr_manager_module, 'MergeStatus')
+    assert hasattr(pr_manager_module, 'PullRequest')
+    assert hasattr(pr_manager_module, 'MergeResult')
+    assert hasattr(pr_manager_module, 'PRManager')
+
+
+def test_pr_manager_init(pr_manager_module):
+    """Test PRManager initialization."""
+    # Test basic init
+    manager = pr_manager_module.PRManager()
+    assert manager.repo_path == "."
+    assert manager.dry_run == False
+    assert manager.target_pr is None
+
+    # Test with parameters
+    manager2 = pr_manager_module.PRManager(
+        repo_path="/tmp",
+        dry_run=True,
+        target_pr=42
+    )
+    assert manager2.repo_path == "/tmp"
+    assert manager2.dry_run == True
+    assert manager2.target_pr == 42
+
+
+def test_dry_run_banner(pr_manager_module, capsys):
+    """Test that dry-run mode announces itself on construction."""
+    pr_manager_module.PRManager(repo_path="/tmp")
+    assert "DRY RUN MODE" not in capsys.readouterr().out
+
+    pr_manager_module.PRManager(repo_path="/tmp", dry_run=True)
+    assert "🔍 DRY RUN MODE - No changes will be made" in capsys.readouterr().out
+
+
+def test_git_command(pr_manager_module, tmp_git_repo):
+    """Test git command execution."""
+    manager = pr_manager_module.PRManager(repo_path=str(tmp_git_repo))
+
+    # One command answers both status and current branch: porcelain v2
+    # prefixes the branch headers with "# branch."
+    exit_code, stdout, stderr = manager.run_git_command(
+        ["status", "--branch", "--porcelain=v2"],
+        check=False
+    )
+    assert exit_code == 0
+
+    headers = dict(
+        line[2:].split(" ", 1) for line in stdout.splitlines() if line.startswith("# ")
+    )
+    assert headers["branch.head"] in ["master", "main"]
+
+    # Binary mode hands back undecoded bytes
+    exit_code, stdout, stderr = manager.run_git_command(
+        ["rev-parse", "--abbrev-ref", "HEAD"],
+        check=False,
+        binary=True
+    )
+    assert exit_code == 0
+    assert stdout == headers["branch.head"].encode()
+
+
+def test_git_spawn_options(pr_manager_module, git_session, monkeypatch):
+    """Test that sync and async git commands both spawn without closing fds."""
+    module = pr_manager_module
+    spawns = []
+    real_run, real_exec = module.subprocess.run, module.asyncio.create_subprocess_exec
+
+    def run(cmd, **kwargs):
+        spawns.append((cmd[0], kwargs.get("close_fds", True)))
+        return real_run(cmd, **kwargs)
+
+    async def create_subprocess_exec(program, *args, **kwargs):
+        spawns.append((program, kwargs.get("close_fds", True)))
+        return await real_exec(program, *args, **kwargs)
+
+    monkeypatch.setattr(module.subprocess, "run", run)
+    monkeypatch.setattr(module.asyncio, "create_subprocess_exec", create_subprocess_exec)
+
+    assert git_session.run_git_command(["rev-parse", "HEAD"], check=False)[0] == 0
+    exit_code, stdout, _ = module.asyncio.run(
+        git_session.run_git_command_async(["rev-parse", "HEAD"])
+    )
+    assert exit_code == 0 and stdout == git_session.resolve_ref("HEAD")
+    assert spawns == [(module._GIT_BIN, False)] * 2
+
+
+def test_resolve_ref(git_session):
+    """Test ref lookups through the persistent cat-file process."""
+    head = git_session.resolve_ref("HEAD")
+    assert head is not None and len(head) >= 40
+    assert git_session.resolve_ref("HEAD^{tree}") not in (None, head)
+    assert git_session.resolve_ref("no-such-branch") is None
+
+    # Every lookup was answered by the same long-lived process
+    proc = git_session._cat_file
+    assert proc is not None and proc.poll() is None
+    assert git_session.resolve_ref("HEAD") == head
+    assert git_session._cat_file is proc
+
+    git_session.close()
+    assert git_session._cat_file is None
+    assert proc.poll() is not None
+
+
+def test_dataclasses(pr_manager_module):
+    """Test dataclass creation."""
+    # Create PullRequest
+    pr = pr_manager_module.PullRequest(
+        number=1,
+        title="Test PR",
+        head_ref="feature",
+        base_ref="main",
+        head_sha="abc123",
+        mergeable=True,
+        url="https://github.com/test/test/pull/1"
+    )
+    assert pr.number == 1
+    assert pr.title == "Test PR"
+
+    # Create MergeResult
+    result = pr_manager_module.MergeResult(
+        pr=pr,
+        status=pr_manager_module.MergeStatus.SUCCESS,
+        conflicting_files=[]
+    )
+    assert result.status == pr_manager_module.MergeStatus.SUCCESS
+    assert len(result.conflicting_files) == 0
+
+
+def test_flush_comments_retries_only_failed(pr_manager_module, monkeypatch):
+    """Test that only comments the API did not apply are re-posted via gh."""
+    manager = pr_manager_module.PRManager(repo_path="/tmp")
+    prs = [
+        pr_manager_module.PullRequest(
+            number=n, title=f"PR {n}", head_ref=f"feat{n}", base_ref="main",
+            head_sha="abc123", mergeable="CONFLICTING",
+            url=f"https://github.com/test/test/pull/{n}", node_id=f"PR_{n}"
+        )
+        for n in (1, 2, 3)
+    ]
+
+    reposted = []
+    monkeypatch.setattr(
+        manager, "_comment_via_gh",
+        lambda pr, comment, gh_token: reposted.append(pr.number) or True
+    )
+
+    # c1 failed; c0 and c2 were applied and must not be posted twice
+    partial = {"c0": {"clientMutationId": None}, "c1": None, "c2": {"clientMutationId": None}}
+    monkeypatch.setattr(
+        manager, "graphql",
+        lambda query, variables: (partial, [{"message": "boom", "path": ["c1"]}])
+    )
+    manager._pending_comments = [(pr, f"comment {pr.number}") for pr in prs]
+    manager.flush_comments()
+    assert reposted == [2]
+    assert manager._pending_comments == []
+
+    # A request that failed outright retries the whole batch
+    reposted.clear()
+    monkeypatch.setattr(manager, "graphql", lambda query, variables: (None, []))
+    manager._pending_comments = [(pr, f"comment {pr.number}") for pr in prs]
+    manager.flush_comments()
+    assert reposted == [1, 2, 3]
+
+
+def test_create_ref(pr_manager_module, origin_clone):
+    """Test that create_ref refuses existing refs and recovers afterwards."""
+    with pr_manager_module.PRManager(repo_path=str(origin_clone)) as manager:
+        oid = manager.resolve_ref("origin/clean")
+        assert manager.create_ref("refs/heads/conflicts/clean", oid) == (True, "")
+        assert _git(origin_clone, "rev-parse", "conflicts/clean") == oid
+
+        created, error = manager.create_ref("refs/heads/conflicts/clean", oid)
+        assert not created and error
+
+        # The failed transaction ended the update-ref process; it restarts
+        assert manager.create_ref("refs/heads/conflicts/stack-a", oid) == (True, "")
+        assert _git(origin_clone, "rev-parse", "conflicts/stack-a") == oid
+
+
+def test_precompute_conflicts(pr_manager_module, origin_clone):
+    """Test in-memory conflict screening against each PR's base."""
+    module = pr_manager_module
+    with module.PRManager(repo_path=str(origin_clone)) as manager:
+        prs = manager.precompute_conflicts(_make_prs(module, origin_clone))
+        # Screening is per PR: stack-b only conflicts once stack-a is in
+        assert [pr.precomputed_conflicts for pr in prs] == [(), ("shared.txt",), (), ()]
+
+        # GitHub's MERGEABLE verdict is trusted; missing branches are left unscreened
+        trusted = replace(prs[1], mergeable=module.GITHUB_MERGEABLE, precomputed_conflicts=None)
+        missing = replace(prs[0], head_ref="no-such-branch", precomputed_conflicts=None)
+        screened = manager.precompute_conflicts([trusted, missing])
+        assert [pr.precomputed_conflicts for pr in screened] == [(), None]
+
+
+def test_merge_in_memory(pr_manager_module, origin_clone):
+    """Test that in-memory merges build commits without publishing them."""
+    module = pr_manager_module
+    before = _origin_heads(origin_clone)
+    clean, conflicting, _, _ = _make_prs(module, origin_clone)
+
+    with module.PRManager(repo_path=str(origin_clone)) as manager:
+        result = manager._merge_in_memory(clean)
+        assert result.status == module.MergeStatus.SUCCESS
+        assert result.base_sha == before["main"]
+        parents = _git(
+            origin_clone, "rev-parse", f"{result.merge_commit}^1", f"{result.merge_commit}^2"
+        )
+        assert parents.split() == [before["main"], before["clean"]]
+
+        result = manager._merge_in_memory(conflicting)
+        assert result.status == module.MergeStatus.CONFLICT
+        assert result.conflicting_files == ["shared.txt"]
+        assert result.merge_commit is None
+
+        result = manager._merge_in_memory(replace(clean, head_ref="main"))
+        assert result.status == module.MergeStatus.SUCCESS
+        assert result.error_message == "No changes to merge"
+        assert result.merge_commit is None
+
+    # Nothing reaches origin until the result is published
+    assert _origin_heads(origin_clone) == before
+    assert _git(origin_clone, "status", "--porcelain") == ""
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_run_merges_stacked(pr_manager_module, origin_clone, monkeypatch, dry_run):
+    """Test a full run: stacked merges, conflicts branches and bulk comments."""
+    module = pr_manager_module
+    before = _origin_heads(origin_clone)
+    prs = [replace(pr, node_id=f"PR_{pr.number}") for pr in _make_prs(module, origin_clone)]
+
+    monkeypatch.setenv("GH_TOKEN", "test-token")
+    monkeypatch.setattr(module, "HTTPX_AVAILABLE", True)
+    mutations = []
+
+    manager = module.PRManager(repo_path=str(origin_clone), dry_run=dry_run)
+    monkeypatch.setattr(manager, "get_open_prs_from_cli", lambda: prs)
+    monkeypatch.setattr(
+        manager, "graphql",
+        lambda query, variables: mutations.append(variables) or ({"c0": {}, "c1": {}}, [])
+    )
+    assert manager.run() == 0
+
+    S, C = module.MergeStatus.SUCCESS, module.MergeStatus.CONFLICT
+    # stack-b merges onto main + clean + stack-a, so it conflicts even in a dry run
+    assert [result.status for result in manager.results] == [S, C, S, C]
+    assert [result.conflicting_files for result in manager.results] == [
+        [], ["shared.txt"], [], ["pair.txt"]
+    ]
+
+    if dry_run:
+        assert _origin_heads(origin_clone) == before
+        assert mutations == []
+        return
+
+    _assert_published(origin_clone, before, merged=[1, 3], conflicted=[2, 4])
+    # Both conflict comments went out in a single request
+    assert len(mutations) == 1
+    assert (mutations[0]["s0"], mutations[0]["s1"]) == ("PR_2", "PR_4")
+    assert "`conflicts/base-conflict`" in mutations[0]["b0"]
+    assert "- `pair.txt`" in mutations[0]["b1"]
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_process_concurrently(pr_manager_module, origin_clone, dry_run, in_memory):
+    """Test per-PR processing, in memory and in worktrees (pre-2.38 git)."""
+    module = pr_manager_module
+    before = _origin_heads(origin_clone)
+
+    # One worker handles the PRs in order, so each sees the pushes before it
+    with module.PRManager(repo_path=str(origin_clone), dry_run=dry_run, max_parallel=1) as manager:
+        if not in_memory:
+            manager.merge_tree_supported = False
+        results = manager.process_concurrently(_make_prs(module, origin_clone))
+
+    S, C = module.MergeStatus.SUCCESS, module.MergeStatus.CONFLICT
+    if dry_run:
+        # Nothing is pushed, so stack-b still merges onto the original main
+        assert [result.status for result in results] == [S, C, S, S]
+        assert _origin_heads(origin_clone) == before
+    else:
+        assert [result.status for result in results] == [S, C, S, C]
+        assert results[3].conflicting_files == ["pair.txt"]
+        _assert_published(origin_clone, before, merged=[1, 3], conflicted=[2, 4])
+    assert results[1].conflicting_files == ["shared.txt"]
+
+    # Worktrees are cleaned up and the shared checkout is left alone
+    assert _git(origin_clone, "worktree", "list").count("\n") == 0
+    assert _git(origin_clone, "status", "--porcelain") == ""
+
+
+def test_merge_status_enum(pr_manager_module):
+    """Test MergeStatus enum."""
+    assert pr_manager_module.MergeStatus.SUCCESS.value == "success"
+    assert pr_manager_module.MergeStatus.CONFLICT.value == "conflict"
+    assert pr_manager_module.MergeStatus.ERROR.value == "error"
+
+
+def test_script_execution(pr_manager_module):
+    """Test that the script's command line parses and shows help."""
+    parser = pr_manager_module.build_arg_parser()
+    help_text = parser.format_help()
+
+    assert "PR Management Agent" in help_text
+    assert "--dry-run" in help_text
+    assert "--pr" in help_text
 
-class PRManagerTester:
-    """Test harness for PR Manager."""
-    
-    def __init__(self):
-        self.test_dir = None
-        self.passed = 0
-        self.failed = 0
-        # Get the directory where this script is located
-        self.script_dir = Path(__file__).parent.absolute()
-        
-    def setup_test_repo(self):
-        """Create a temporary test repository."""
-        print("🔧 Setting up test repository...")
-        self.test_dir = tempfile.mkdtemp(prefix="pr_manager_test_")
-        print(f"   Test directory: {self.test_dir}")
-        
-        os.chdir(self.test_dir)
-        
-        # Initialize git repo
-        subprocess.run(["git", "init"], check=True, capture_output=True)
-        subprocess.run(["git", "config", "user.name", "Test User"], check=True)
-        subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
-        
-        # Create initial commit
-        Path("README.md").write_text("# Test Repo\n")
-        subprocess.run(["git", "add", "README.md"], check=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit"], check=True)
-        
-        print("✓ Test repository created")
-        
-    def cleanup(self):
-        """Clean up test repository."""
-        if self.test_dir and os.path.exists(self.test_dir):
-            os.chdir("/")
-            shutil.rmtree(self.test_dir)
-            print(f"🧹 Cleaned up test directory")
-    
-    def test_import(self):
-        """Test that pr_manager can be imported."""
-        print("\n📦 Test: Import pr_manager module")
-        try:
-            sys.path.insert(0, str(self.script_dir))
-            import pr_manager
-            print("✓ Module imported successfully")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Failed to import: {e}")
-            self.failed += 1
-            return False
-    
-    def test_classes(self):
-        """Test that required classes exist."""
-        print("\n🏗️  Test: Check class definitions")
-        try:
-            import pr_manager
-            
-            # Check classes exist
-            assert hasattr(pr_manager, 'MergeStatus')
-            assert hasattr(pr_manager, 'PullRequest')
-            assert hasattr(pr_manager, 'MergeResult')
-            assert hasattr(pr_manager, 'PRManager')
-            
-            print("✓ All required classes defined")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Class check failed: {e}")
-            self.failed += 1
-            return False
-    
-    def test_pr_manager_init(self):
-        """Test PRManager initialization."""
-        print("\n🎯 Test: PRManager initialization")
-        try:
-            import pr_manager
-            
-            # Test basic init
-            manager = pr_manager.PRManager()
-            assert manager.repo_path == "."
-            assert manager.dry_run == False
-            assert manager.target_pr is None
-            
-            # Test with parameters
-            manager2 = pr_manager.PRManager(
-                repo_path="/tmp",
-                dry_run=True,
-                target_pr=42
-            )
-            assert manager2.repo_path == "/tmp"
-            assert manager2.dry_run == True
-            assert manager2.target_pr == 42
-            
-            print("✓ PRManager initializes correctly")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Initialization test failed: {e}")
-            self.failed += 1
-            return False
-    
-    def test_git_command(self):
-        """Test git command execution."""
-        print("\n💻 Test: Git command execution")
-        try:
-            import pr_manager
-            
-            self.setup_test_repo()
-            manager = pr_manager.PRManager(repo_path=self.test_dir)
-            
-            # Test successful command
-            exit_code, stdout, stderr = manager.run_git_command(
-                ["status", "--porcelain"],
-                check=False
-            )
-            assert exit_code == 0
-            
-            # Test current branch
-            exit_code, stdout, stderr = manager.run_git_command(
-                ["branch", "--show-current"],
-                check=False
-            )
-            assert exit_code == 0
-            assert stdout in ["master", "main"]
-            
-            print("✓ Git commands execute correctly")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Git command test failed: {e}")
-            self.failed += 1
-            return False
-        finally:
-            self.cleanup()
-    
-    def test_dataclasses(self):
-        """Test dataclass creation."""
-        print("\n📋 Test: Dataclass creation")
-        try:
-            import pr_manager
-            
-            # Create PullRequest
-            pr = pr_manager.PullRequest(
-                number=1,
-                title="Test PR",
-                head_ref="feature",
-                base_ref="main",
-                head_sha="abc123",
-                mergeable=True,
-                url="https://github.com/test/test/pull/1"
-            )
-            assert pr.number == 1
-            assert pr.title == "Test PR"
-            
-            # Create MergeResult
-            result = pr_manager.MergeResult(
-                pr=pr,
-                status=pr_manager.MergeStatus.SUCCESS,
-                conflicting_files=[]
-            )
-            assert result.status == pr_manager.MergeStatus.SUCCESS
-            assert len(result.conflicting_files) == 0
-            
-            print("✓ Dataclasses work correctly")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Dataclass test failed: {e}")
-            self.failed += 1
-            return False
-    
-    def test_merge_status_enum(self):
-        """Test MergeStatus enum."""
-        print("\n🔢 Test: MergeStatus enum")
-        try:
-            import pr_manager
-            
-            assert pr_manager.MergeStatus.SUCCESS.value == "success"
-            assert pr_manager.MergeStatus.CONFLICT.value == "conflict"
-            assert pr_manager.MergeStatus.ERROR.value == "error"
-            
-            print("✓ MergeStatus enum values correct")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Enum test failed: {e}")
-            self.failed += 1
-            return False
-    
-    def test_script_execution(self):
-        """Test that the script can be executed."""
-        print("\n🚀 Test: Script execution")
-        try:
-            pr_manager_path = self.script_dir / "pr_manager.py"
-            result = subprocess.run(
-                ["python3", str(pr_manager_path), "--help"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            assert result.returncode == 0
-            assert "PR Management Agent" in result.stdout
-            assert "--dry-run" in result.stdout
-            assert "--pr" in result.stdout
-            
-            print("✓ Script executes and shows help")
-            self.passed += 1
-            return True
-        except Exception as e:
-            print(f"✗ Script execution test failed: {e}")
-            self.failed += 1
-            return False
-    
-    def run_all_tests(self):
-        """Run all tests."""
-        print("="*60)
-        print("PR Manager Test Suite")
-        print("="*60)
-        
-        # Run tests
-        self.test_import()
-        self.test_classes()
-        self.test_dataclasses()
-        self.test_merge_status_enum()
-        self.test_pr_manager_init()
-        self.test_git_command()
-        self.test_script_execution()
-        
-        # Print summary
-        print("\n" + "="*60)
-        print("Test Summary")
-        print("="*60)
-        print(f"✅ Passed: {self.passed}")
-        print(f"❌ Failed: {self.failed}")
-        total = self.passed + self.failed
-        if total > 0:
-            percentage = (self.passed / total) * 100
-            print(f"📊 Success Rate: {percentage:.1f}%")
-        print("="*60)
-        
-        return 0 if self.failed == 0 else 1
-
-
-def main():
-    """Main entry point."""
-    tester = PRManagerTester()
-    try:
-        return tester.run_all_tests()
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Tests interrupted by user")
-        return 1
-    except Exception as e:
-        print(f"\n\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    finally:
-        tester.cleanup()
+    args = parser.parse_args(["--dry-run", "--pr", "42"])
+    assert args.dry_run is True
+    assert args.pr == 42
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -7,7 +7,8 @@ Run with: pytest tests/test_bridge_integration.py -v
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from music_brain.structure.comprehensive_engine import (
     render_plan_to_midi,
@@ -15,7 +16,9 @@ from music_brain.structure.comprehensive_engine import (
 )
 
 
-@pytest.fixture
+# The renderer only reads its plan, so each plan is built once per module
+# and shared; tests must not mutate it.
+@pytest.fixture(scope="module")
 def mock_plan():
     """Create a basic HarmonyPlan for testing."""
     return HarmonyPlan(
@@ -32,7 +35,7 @@ def mock_plan():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_plan_major():
     """Create a major key HarmonyPlan."""
     return HarmonyPlan(
@@ -62,10 +65,9 @@ def test_render_bridge_success(mock_parse, MockLogicProject, mock_plan):
     mock_project_instance.export_midi.return_value = "path/to/output.mid"
     mock_project_instance.ppq = 480
 
-    # Mock parsed chord
-    mock_chord = MagicMock()
-    mock_chord.root_num = 0   # C
-    mock_chord.quality = "min"
+    # Parsed chord stub: the bridge only reads these attributes, so a
+    # plain namespace stands in for a call-recording MagicMock
+    mock_chord = SimpleNamespace(root_num=0, quality="min")  # C
     mock_parse.return_value = [mock_chord, mock_chord, mock_chord, mock_chord]
 
     output = render_plan_to_midi(mock_plan, "output.mid")
@@ -102,9 +104,7 @@ def test_render_bridge_creates_guide_tones(mock_parse, MockLogicProject, mock_pl
     mock_project_instance.export_midi.return_value = "output.mid"
     mock_project_instance.ppq = 480
 
-    mock_chord = MagicMock()
-    mock_chord.root_num = 0
-    mock_chord.quality = "min7"  # 4-note chord for guide tones
+    mock_chord = SimpleNamespace(root_num=0, quality="min7")  # 4-note chord for guide tones
     mock_parse.return_value = [mock_chord, mock_chord]
 
     render_plan_to_midi(mock_plan, "output.mid", include_guide_tones=True)
@@ -125,9 +125,7 @@ def test_render_bridge_no_guide_tones_when_disabled(mock_parse, MockLogicProject
     mock_project_instance.export_midi.return_value = "output.mid"
     mock_project_instance.ppq = 480
 
-    mock_chord = MagicMock()
-    mock_chord.root_num = 0
-    mock_chord.quality = "min"
+    mock_chord = SimpleNamespace(root_num=0, quality="min")
     mock_parse.return_value = [mock_chord]
 
     render_plan_to_midi(mock_plan, "output.mid", include_guide_tones=False)
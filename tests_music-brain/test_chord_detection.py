@@ -14,6 +14,19 @@ from unittest.mock import patch, MagicMock
 import math
 
 
+# Keyed on chord_detection.LIBROSA_AVAILABLE, i.e. librosa actually
+# imported (not merely installed); the string condition is evaluated
+# lazily at setup, so collection never imports librosa
+requires_librosa = pytest.mark.skipif(
+    "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE",
+    reason="librosa not available"
+)
+
+# Everything here imports chord_detection (and so librosa); under
+# `-n auto --dist=loadgroup` that import then happens on one worker only
+pytestmark = pytest.mark.xdist_group("audio")
+
+
 class TestChordDetection:
     """Tests for ChordDetection dataclass."""
 
@@ -310,9 +323,7 @@ class TestChordDetectorCreation:
             with pytest.raises(ImportError, match="librosa required"):
                 ChordDetector()
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_detector_creation_with_defaults(self):
         """Test ChordDetector creation with default parameters."""
         from music_brain.audio.chord_detection import ChordDetector
@@ -323,9 +334,7 @@ class TestChordDetectorCreation:
         assert detector.window_size == 0.5
         assert detector.min_confidence == 0.3
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_detector_creation_with_custom_params(self):
         """Test ChordDetector creation with custom parameters."""
         from music_brain.audio.chord_detection import ChordDetector
@@ -344,9 +353,7 @@ class TestChordDetectorCreation:
 class TestChordMatching:
     """Tests for chord template matching logic."""
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_create_chord_template(self):
         """Test chord template creation."""
         from music_brain.audio.chord_detection import _create_chord_template
@@ -368,9 +375,7 @@ class TestChordMatching:
         # Should be normalized
         assert abs(np.sum(template) - 1.0) < 0.001
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_match_chord_major(self):
         """Test matching a clear major chord chroma."""
         from music_brain.audio.chord_detection import _match_chord
@@ -388,9 +393,7 @@ class TestChordMatching:
         assert quality == "maj"
         assert confidence > 0.5
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_match_chord_minor(self):
         """Test matching a clear minor chord chroma."""
         from music_brain.audio.chord_detection import _match_chord
@@ -413,9 +416,7 @@ class TestChordMatching:
 class TestChordDetectorMethods:
     """Tests for ChordDetector methods with mocked librosa."""
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_merge_consecutive_chords(self):
         """Test merging consecutive identical chords."""
         from music_brain.audio.chord_detection import ChordDetector, ChordDetection
@@ -438,9 +439,7 @@ class TestChordDetectorMethods:
         assert merged[1].chord_name == "G"
         assert merged[2].chord_name == "Am"
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_merge_empty_list(self):
         """Test merging empty chord list."""
         from music_brain.audio.chord_detection import ChordDetector
@@ -451,9 +450,7 @@ class TestChordDetectorMethods:
 
         assert merged == []
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_estimate_key_from_chords(self):
         """Test key estimation from chord sequence."""
         from music_brain.audio.chord_detection import ChordDetector, ChordDetection
@@ -474,9 +471,7 @@ class TestChordDetectorMethods:
         # C is the most common root
         assert "C" in key
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_estimate_key_empty_list(self):
         """Test key estimation with empty chord list."""
         from music_brain.audio.chord_detection import ChordDetector
@@ -487,9 +482,7 @@ class TestChordDetectorMethods:
 
         assert key is None
 
-    @pytest.mark.skipif(
-        "not __import__('music_brain.audio.chord_detection', fromlist=['LIBROSA_AVAILABLE']).LIBROSA_AVAILABLE"
-    )
+    @requires_librosa
     def test_confidence_score(self):
         """Test confidence score retrieval."""
         from music_brain.audio.chord_detection import ChordDetector, ChordDetection
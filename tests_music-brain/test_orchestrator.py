@@ -381,6 +381,17 @@ class TestBridgeAPISafety:
         assert 20 <= resolved["tempo"] <= 300
         assert 1 <= resolved["grid"] <= 64
 
+        # The caller's dict is never modified
+        assert params["tempo"] == 500
+
+    def test_resolve_contradictions_valid_passthrough(self):
+        """Test: Valid parameters come back as-is, without a copy"""
+        from music_brain.orchestrator.bridge_api import resolve_contradictions
+
+        params = {"chaos": 0.5, "tempo": 120, "velocity_min": 40, "velocity_max": 120}
+
+        assert resolve_contradictions(params) is params
+
     def test_synesthesia_known_word(self):
         """Test 16: Get parameter for known word"""
         from music_brain.orchestrator.bridge_api import get_parameter
@@ -405,6 +416,10 @@ class TestBridgeAPISafety:
         assert 0.0 <= result1["chaos"] <= 1.0
         assert 0.0 <= result1["complexity"] <= 1.0
 
+        # Stable across processes: derived from the word's CRC-32
+        assert result1["chaos"] == pytest.approx(0.4137026)
+        assert result1["complexity"] == pytest.approx(0.1325246)
+
     def test_synesthesia_different_words(self):
         """Test 16: Different words give different parameters"""
         from music_brain.orchestrator.bridge_api import get_parameter
@@ -415,6 +430,86 @@ class TestBridgeAPISafety:
         # Different words should give different results
         assert result1 != result2
 
+    def test_synesthesia_cached_lookup(self):
+        """Test 16: Cached lookups normalize case and hand out copies"""
+        from music_brain.orchestrator.bridge_api import clear_parameter_cache, get_parameter
+
+        clear_parameter_cache()
+        result = get_parameter("HaPpY")
+        result["chaos"] = 1.0  # Caller mutation must not leak into the cache
+
+        assert get_parameter(" happy ") == {"chaos": 0.3, "complexity": 0.4}
+        assert get_parameter("testword123") == get_parameter("TESTWORD123")
+
+    def test_load_genre_definitions_cached(self, tmp_path):
+        """Genre definitions are parsed once per file"""
+        from music_brain.orchestrator.bridge_api import clear_genre_cache, load_genre_definitions
+
+        path = tmp_path / "GenreDefinitions.json"
+        path.write_text('{"genres": {"lofi_hiphop": {"emotional_tags": ["chill"]}}}')
+
+        genres = load_genre_definitions(str(path))
+        assert genres["lofi_hiphop"]["emotional_tags"] == ["chill"]
+        assert load_genre_definitions(str(path)) is genres
+        # Clearing the cache picks up edits to the file
+        path.write_text('{"genres": {"lofi_hiphop": {"emotional_tags": ["mellow"]}}}')
+        clear_genre_cache()
+        assert load_genre_definitions(str(path))["lofi_hiphop"]["emotional_tags"] == ["mellow"]
+        # A missing file is not remembered: once it appears, it loads
+        late = tmp_path / "missing.json"
+        assert load_genre_definitions(str(late)) == {}
+        late.write_text('{"genres": {"jazz_fusion": {}}}')
+        assert load_genre_definitions(str(late)) == {"jazz_fusion": {}}
+
+    def test_bridge_result_event_columns(self):
+        """MIDI events export as one array per field"""
+        from music_brain.orchestrator.bridge_api import BridgeResult, MidiEvent
+
+        result = BridgeResult(success=True, midi_events=[
+            MidiEvent(status=0x90, data1=60, data2=100, timestamp=0),
+            MidiEvent(status=0x80, data1=60, data2=0, timestamp=22050),
+        ])
+        columns = result.event_columns()
+
+        assert columns["status"].tolist() == [0x90, 0x80]
+        assert columns["timestamp"].tolist() == [0, 22050]
+        assert columns["data1"].dtype.itemsize == 1
+        assert BridgeResult(success=True).event_columns()["data2"].size == 0
+
+    def test_bridge_result_packed_events(self):
+        """Packed uint64 events unpack to the original MidiEvents"""
+        from music_brain.orchestrator.bridge_api import (
+            BridgeResult,
+            MidiEvent,
+            unpack_midi_events,
+        )
+
+        events = [
+            MidiEvent(status=0x90, data1=60, data2=127, timestamp=0),
+            MidiEvent(status=0x80, data1=60, data2=0, timestamp=2**32),
+        ]
+        packed = BridgeResult(success=True, midi_events=events).packed_events()
+
+        assert packed.itemsize == 8
+        assert packed[0] == (0x90 << 16) | (60 << 8) | 127
+        assert unpack_midi_events(packed) == events
+
+    def test_bridge_result_json_bytes(self):
+        """JSON bytes decode back to to_dict()"""
+        import json
+        from music_brain.orchestrator.bridge_api import BridgeResult, MidiEvent
+
+        result = BridgeResult(
+            success=True,
+            midi_events=[MidiEvent(status=0x90, data1=60, data2=100, timestamp=0)],
+            detected_genre="lofi_hiphop",
+            metadata={"chords": ["C", "G"], "tempo": 90},
+        )
+        payload = result.to_json_bytes()
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == result.to_dict()
+
     def test_ghost_hands_with_synesthesia(self):
         """Test 16: Ghost Hands uses Synesthesia for unknown words"""
         from music_brain.orchestrator.bridge_api import (
@@ -471,3 +566,47 @@ class TestInputSanitization:
         assert genre == ""
         assert confidence == 0.0
 
+    def test_genre_detection_caller_dicts(self):
+        """Caller-owned genre dicts are scanned as they are now, edits included"""
+        from music_brain.orchestrator.bridge_api import detect_genre_from_text
+
+        genres = {"lofi_hiphop": {"emotional_tags": ["chill"]}}
+        assert detect_genre_from_text("Very CHILL beats", genres) == ("lofi_hiphop", 0.2)
+
+        genres["lofi_hiphop"]["emotional_tags"].append("beats")
+        assert detect_genre_from_text("Very CHILL beats", genres) == ("lofi_hiphop", 0.4)
+
+    def test_genre_detection_loaded_definitions(self, tmp_path):
+        """Loaded definitions go through the compiled, memoized scorer"""
+        from music_brain.orchestrator.bridge_api import (
+            detect_genre_from_text,
+            load_genre_definitions,
+        )
+
+        path = tmp_path / "GenreDefinitions.json"
+        path.write_text('{"genres": {"lofi_hiphop": {"emotional_tags": ["Chill"]}}}')
+        genres = load_genre_definitions(str(path))
+
+        assert detect_genre_from_text("very chill", genres) == ("lofi_hiphop", 0.2)
+        assert detect_genre_from_text("very chill", dict(genres)) == ("lofi_hiphop", 0.2)
+
+
+    def test_bridge_prompts_reuse_genre_scorer(self, tmp_path):
+        """Repeated bridge prompts are scored once against the loaded definitions"""
+        from music_brain.orchestrator import bridge_api
+
+        path = tmp_path / "GenreDefinitions.json"
+        path.write_text('{"genres": {"funk_groove": {"emotional_tags": ["Funky"]}}}')
+
+        # PythonBridge loads the definitions once and passes that dict on every call
+        genres = bridge_api.load_genre_definitions(str(path))
+        for _ in range(3):
+            result = asyncio.run(bridge_api.process_prompt(
+                "make it funky", knobs={"chaos": 0.5}, genres=genres
+            ))
+            assert result.success
+            assert result.detected_genre == "funk_groove"
+
+        _, scorer = bridge_api._genre_scorer_cache
+        assert scorer.cache_info().misses == 1
+        assert scorer.cache_info().hits == 2